@@ -8,7 +8,7 @@ from typing import Optional
 
 from bot.config import config
 from bot.services.alert_store import AlertStore
-from bot.services.github_service import GitHubService
+from bot.services.github_service import AsyncGitHubService
 from bot.utils.discord_helpers import (
     create_alert_embed,
     create_alert_buttons,
@@ -24,7 +24,7 @@ class AlertCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.alert_store = AlertStore()
-        self.github_service = GitHubService()
+        self.github_service = AsyncGitHubService()
     
     @app_commands.command(name="alerts", description="List recent alerts")
     @app_commands.describe(
@@ -221,7 +221,7 @@ class AlertCommands(commands.Cog):
         
         # Create PR
         try:
-            pr_url = self.github_service.create_pr_from_alert(
+            pr_url = await self.github_service.create_pr_from_alert(
                 alert=alert,
                 base_branch=base_branch,
                 fix_notes=fix_notes
@@ -283,7 +283,7 @@ class AlertCommands(commands.Cog):
         
         # Create issue
         try:
-            issue_url = self.github_service.create_issue_from_alert(alert)
+            issue_url = await self.github_service.create_issue_from_alert(alert)
             
             if issue_url:
                 # Update alert with issue URL
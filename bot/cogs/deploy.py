@@ -6,8 +6,10 @@ from discord.ext import commands, tasks
 from discord import app_commands
 import logging
 import asyncio
+import re
 from typing import Optional
 from github import Github
+from urllib3.util.retry import Retry
 from bot.config import config
 from bot.utils.discord_helpers import has_required_role
 from bot.services.deploy_executor import DeploymentExecutor
@@ -15,15 +17,31 @@ from bot.services.deployment_store import DeploymentStore, Deployment
 
 logger = logging.getLogger("jinkies.deploy")
 
+# Compiled once; the deploy handler scans its output logs with this
+# after every successful run
+_INVALIDATION_RE = re.compile(r"Invalidation created: ([A-Z0-9]+)")
+
 
 class DeploymentCommands(commands.Cog):
     """Commands for deployment monitoring and triggering."""
     
     def __init__(self, bot):
         self.bot = bot
-        self.github_client = Github(config.GITHUB_PRIVATE_KEY)
+        # Pooled connections + retries: the monitor loops poll every
+        # minute or two and should reuse one TLS connection
+        self.github_client = Github(
+            config.GITHUB_PRIVATE_KEY,
+            pool_size=10,
+            per_page=100,
+            retry=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
         self.repo = self.github_client.get_repo(f"{config.GITHUB_REPO_OWNER}/{config.GITHUB_REPO_NAME}")
         self.last_run_id = None
+
+        # Strong references to fire-and-forget tasks: the loop only
+        # keeps weak refs, so an unreferenced task can be garbage
+        # collected before it runs
+        self._background_tasks = set()
         
         # Initialize deployment store
         self.deployment_store = DeploymentStore("deployments.db")
@@ -170,6 +188,38 @@ class DeploymentCommands(commands.Cog):
         """Wait for bot to be ready before monitoring."""
         await self.bot.wait_until_ready()
     
+    def _spawn(self, coro):
+        """Run a coroutine in the background, holding a strong reference."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _notify(self, channel, *args, **kwargs):
+        """Best-effort channel send for non-critical notifications.
+
+        Run via _spawn so observability posts never block the deploy
+        critical path; failures are logged, not raised.
+        """
+        try:
+            await channel.send(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Deploy notification failed: {e}")
+
+    async def _post_logs_and_cleanup(self, temp_channel, output):
+        """Post deployment logs to the temp channel, then delete it."""
+        try:
+            if output:
+                log_chunks = [output[i:i+1900] for i in range(0, len(output), 1900)]
+                for chunk in log_chunks[:10]:  # Max 10 chunks
+                    await temp_channel.send(f"```\n{chunk}\n```")
+
+            # Delete channel after 30 seconds
+            await asyncio.sleep(30)
+            await temp_channel.delete(reason="Deployment completed successfully")
+        except Exception as e:
+            logger.warning(f"Temp channel cleanup failed: {e}")
+
     @app_commands.command(name="deploy", description="Deploy develop branch to production")
     @app_commands.describe(
         method="Deployment method: 'direct' (run locally) or 'github' (GitHub Actions)"
@@ -212,8 +262,7 @@ class DeploymentCommands(commands.Cog):
                     status="in_progress",
                     method="direct"
                 )
-                deployment_id = self.deployment_store.save_deployment(deployment)
-                deployment.id = deployment_id
+                deployment_id = self.deployment_store.upsert_deployment(deployment)
                 
                 # Create temporary channel for this deployment
                 if category:
@@ -224,7 +273,7 @@ class DeploymentCommands(commands.Cog):
                         topic=f"Deployment #{deployment_id} of {ref} by {interaction.user.name}"
                     )
                     deployment.discord_channel_id = str(temp_channel.id)
-                    self.deployment_store.update_deployment(deployment)
+                    self.deployment_store.upsert_deployment(deployment)
                 
                 # Direct deployment execution
                 embed = discord.Embed(
@@ -240,12 +289,13 @@ class DeploymentCommands(commands.Cog):
                 
                 await interaction.followup.send(embed=embed)
                 
-                # Post to deploy channel
+                # Post to deploy channel off the critical path
                 if deploy_channel:
-                    await deploy_channel.send(
+                    self._spawn(self._notify(
+                        deploy_channel,
                         f"🚀 {interaction.user.mention} started deployment of `{ref}`",
                         embed=embed
-                    )
+                    ))
                 
                 # Execute deployment
                 result = await self.executor.deploy(branch=ref)
@@ -262,13 +312,11 @@ class DeploymentCommands(commands.Cog):
                     deployment.status = "success"
                     
                     # Extract CloudFront invalidation ID from logs
-                    if "Invalidation created:" in deployment.output_logs:
-                        import re
-                        match = re.search(r'Invalidation created: ([A-Z0-9]+)', deployment.output_logs)
-                        if match:
-                            deployment.cloudfront_invalidation_id = match.group(1)
+                    match = _INVALIDATION_RE.search(deployment.output_logs)
+                    if match:
+                        deployment.cloudfront_invalidation_id = match.group(1)
                     
-                    self.deployment_store.update_deployment(deployment)
+                    self.deployment_store.upsert_deployment(deployment)
                     success_embed = discord.Embed(
                         title="✅ Deployment Successful",
                         description=f"Successfully deployed `{ref}`",
@@ -281,28 +329,25 @@ class DeploymentCommands(commands.Cog):
                     
                     await interaction.followup.send(embed=success_embed)
                     
-                    # Post success to deploy channel
+                    # Post success to deploy channel off the critical path
                     if deploy_channel:
-                        await deploy_channel.send(
+                        self._spawn(self._notify(
+                            deploy_channel,
                             f"✅ Deployment of `{ref}` completed successfully",
                             embed=success_embed
-                        )
-                    
-                    # Post full logs to temporary channel
+                        ))
+
+                    # Post full logs to the temporary channel and clean it
+                    # up in the background - the 30s grace delete used to
+                    # hold the command handler open
                     if temp_channel:
-                        output = result["output"]
-                        if output:
-                            log_chunks = [output[i:i+1900] for i in range(0, len(output), 1900)]
-                            for chunk in log_chunks[:10]:  # Max 10 chunks
-                                await temp_channel.send(f"```\n{chunk}\n```")
-                        
-                        # Delete channel after 30 seconds
-                        await asyncio.sleep(30)
-                        await temp_channel.delete(reason="Deployment completed successfully")
+                        self._spawn(
+                            self._post_logs_and_cleanup(temp_channel, result["output"])
+                        )
                 else:
                     deployment.status = "failed"
                     deployment.error_message = result.get("error", "Unknown error")
-                    self.deployment_store.update_deployment(deployment)
+                    self.deployment_store.upsert_deployment(deployment)
                     
                     error_embed = discord.Embed(
                         title="❌ Deployment Failed",
@@ -315,16 +360,19 @@ class DeploymentCommands(commands.Cog):
                     
                     await interaction.followup.send(embed=error_embed)
                     
-                    # Post error to deploy channel
+                    # Post error to deploy channel off the critical path
                     if deploy_channel:
-                        await deploy_channel.send(
+                        self._spawn(self._notify(
+                            deploy_channel,
                             f"❌ Deployment of `{ref}` failed",
                             embed=error_embed
-                        )
-                    
+                        ))
+
                     # Post error logs to temporary channel (keep it for debugging)
                     if temp_channel:
-                        await temp_channel.send(f"**Error:**\n```\n{result['error']}\n```")
+                        self._spawn(
+                            self._notify(temp_channel, f"**Error:**\n```\n{result['error']}\n```")
+                        )
                     
             elif method == "github":
                 # GitHub Actions deployment
@@ -362,7 +410,7 @@ class DeploymentCommands(commands.Cog):
             error_msg = f"❌ Error: {str(e)}"
             await interaction.followup.send(error_msg)
             if deploy_channel:
-                await deploy_channel.send(error_msg)
+                self._spawn(self._notify(deploy_channel, error_msg))
             # Keep temp channel on error for debugging
     
     @app_commands.command(name="deploy-status", description="Check deployment status")
@@ -7,11 +7,14 @@ log commands will be disabled but other bot features will work.
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
+import logging
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime
 
 from bot.config import config
 
+logger = logging.getLogger("jinkies.logs")
+
 # Try to import CloudWatch service
 try:
     from bot.services.cloudwatch import CloudWatchService
@@ -95,7 +98,7 @@ class LogCommands(commands.Cog):
         
         # Fetch logs
         try:
-            logs = self.cloudwatch.get_logs(
+            logs = await self.cloudwatch.get_logs_async(
                 log_group=log_group,
                 log_level=level,
                 since_minutes=since,
@@ -246,24 +249,17 @@ class LogCommands(commands.Cog):
                     continue
                 
                 # Fetch new logs
-                logs = self.cloudwatch.tail_logs(
+                logs, max_ts = await self.cloudwatch.tail_logs_async(
                     log_group=session_data["log_group"],
                     log_level=session_data["level"],
                     last_seen_timestamp=session_data["last_timestamp"]
                 )
-                
+
                 if logs:
-                    # Update last seen timestamp
-                    last_log = logs[-1]
-                    try:
-                        # Parse timestamp and convert to milliseconds
-                        log_timestamp = datetime.fromisoformat(last_log.timestamp.replace('Z', '+00:00'))
-                        session_data["last_timestamp"] = int(log_timestamp.timestamp() * 1000)
-                    except (ValueError, AttributeError) as e:
-                        print(f"Error parsing log timestamp: {e}")
-                        # Use current time as fallback
-                        session_data["last_timestamp"] = int(datetime.now(timezone.utc).timestamp() * 1000)
-                    
+                    # Track the server-side cursor so the next poll never
+                    # re-reads events we already delivered
+                    session_data["last_timestamp"] = max_ts
+
                     # Send logs to channel
                     channel = self.bot.get_channel(session_data["channel_id"])
                     if channel:
@@ -272,8 +268,8 @@ class LogCommands(commands.Cog):
                         for chunk in chunks:
                             await channel.send(chunk)
             
-            except Exception as e:
-                print(f"Error in tail task: {e}")
+            except Exception:
+                logger.exception("Error in tail task")
                 sessions_to_remove.append(session_id)
         
         # Clean up finished sessions
@@ -6,6 +6,7 @@ from discord.ext import commands
 from aiohttp import web
 import asyncio
 import logging
+import orjson
 from datetime import datetime, timezone
 from bot.config import config
 from bot.services.alert_store import AlertStore
@@ -33,6 +34,10 @@ class WebhookListener(commands.Cog):
     async def cog_unload(self):
         """Stop webhook server when cog unloads."""
         await self.stop_server()
+
+        # Close the pooled GitHub session the alert handlers share
+        from bot.services.github_service import close_session
+        await close_session()
     
     async def start_server(self):
         """Start the webhook HTTP server."""
@@ -56,8 +61,10 @@ class WebhookListener(commands.Cog):
     async def handle_alert(self, request):
         """Handle incoming alert webhook."""
         try:
-            data = await request.json()
-            
+            # orjson parses the payload (stack traces + related logs can be
+            # tens of KB) several times faster than stdlib json
+            data = orjson.loads(await request.read())
+
             # Create alert object (only use fields that Alert model accepts)
             alert = Alert(
                 django_alert_id=data.get('alert_id'),  # UUID from Django
@@ -175,11 +182,11 @@ class WebhookListener(commands.Cog):
     
     async def handle_create_pr_reaction(self, alert, channel, user):
         """Handle PR creation from reaction."""
-        from bot.services.github_service import GitHubService
-        
+        from bot.services.github_service import AsyncGitHubService
+
         try:
-            github_service = GitHubService()
-            pr_url = github_service.create_pr_from_alert(alert)
+            github_service = AsyncGitHubService()
+            pr_url = await github_service.create_pr_from_alert(alert)
             
             if pr_url:
                 self.alert_store.update_github_links(alert.alert_id, pr_url=pr_url)
@@ -192,11 +199,11 @@ class WebhookListener(commands.Cog):
     
     async def handle_create_pr_with_copilot_reaction(self, alert, channel, user):
         """Handle PR creation with Copilot assignment from reaction."""
-        from bot.services.github_service import GitHubService
-        
+        from bot.services.github_service import AsyncGitHubService
+
         try:
-            github_service = GitHubService()
-            pr_url = github_service.create_pr_from_alert(alert)
+            github_service = AsyncGitHubService()
+            pr_url = await github_service.create_pr_from_alert(alert)
             
             if pr_url:
                 # Extract PR number from URL
@@ -204,8 +211,10 @@ class WebhookListener(commands.Cog):
                 
                 # Assign to Copilot (using a comment)
                 try:
-                    pr = github_service.repo.get_pull(pr_number)
-                    pr.create_issue_comment("@copilot Please implement the fix described in the PR description.")
+                    await github_service.create_pr_comment(
+                        pr_number,
+                        "@copilot Please implement the fix described in the PR description."
+                    )
                     logger.info(f"Assigned PR #{pr_number} to Copilot")
                 except Exception as comment_error:
                     logger.warning(f"Could not add copilot comment: {comment_error}")
@@ -236,11 +245,11 @@ class WebhookListener(commands.Cog):
     
     async def handle_create_issue_reaction(self, alert, channel, user):
         """Handle issue creation from reaction."""
-        from bot.services.github_service import GitHubService
-        
+        from bot.services.github_service import AsyncGitHubService
+
         try:
-            github_service = GitHubService()
-            issue_url = github_service.create_issue_from_alert(alert)
+            github_service = AsyncGitHubService()
+            issue_url = await github_service.create_issue_from_alert(alert)
             
             if issue_url:
                 self.alert_store.update_github_links(alert.alert_id, issue_url=issue_url)
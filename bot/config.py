@@ -3,7 +3,7 @@ Configuration management for the Discord bot.
 Loads environment variables and provides validation.
 """
 import os
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,7 +20,11 @@ class BotConfig:
     DISCORD_LOG_CHANNEL_ID: int = int(os.getenv("DISCORD_LOG_CHANNEL_ID", "0"))
     DISCORD_DEPLOY_CHANNEL_ID: int = int(os.getenv("DISCORD_DEPLOY_CHANNEL_ID", "0"))
     DISCORD_COPILOT_CHANNEL_ID: int = int(os.getenv("DISCORD_COPILOT_CHANNEL_ID", "0"))
-    DISCORD_ALLOWED_ROLES: List[str] = os.getenv("DISCORD_ALLOWED_ROLES", "Admin,DevOps").split(",")
+    # frozenset: role checks run per command/button click, so membership
+    # tests should be O(1) rather than a list scan
+    DISCORD_ALLOWED_ROLES: FrozenSet[str] = frozenset(
+        os.getenv("DISCORD_ALLOWED_ROLES", "Admin,DevOps").split(",")
+    )
     
     # GitHub
     GITHUB_APP_ID: Optional[str] = os.getenv("GITHUB_APP_ID")
@@ -81,22 +85,21 @@ class BotConfig:
         
         return errors
     
+    # Lookup tables resolved once at class definition; both methods below
+    # sit on per-alert / per-command paths
+    _DEV_ENVIRONMENTS = frozenset({"development", "dev", "local"})
+    _SERVICE_LOG_GROUPS = {
+        "api": CLOUDWATCH_LOG_GROUP_API,
+        "django": CLOUDWATCH_LOG_GROUP_API,
+        "cloudfront": CLOUDWATCH_LOG_GROUP_CLOUDFRONT,
+    }
+
     @classmethod
     def get_alert_channel_id(cls, environment: str = None) -> int:
         """Get the appropriate alert channel ID based on environment."""
         env = environment or cls.ENVIRONMENT_NAME
         
-        if env.lower() in ["development", "dev", "local"]:
-            return cls.DISCORD_ALERT_CHANNEL_DEV_ID or cls.DISCORD_ALERT_CHANNEL_ID
-        
-        return cls.DISCORD_ALERT_CHANNEL_ID
-    
-    @classmethod
-    def get_alert_channel_id(cls, environment: str = None) -> int:
-        """Get the appropriate alert channel ID based on environment."""
-        env = environment or cls.ENVIRONMENT_NAME
-        
-        if env.lower() in ["development", "dev", "local"]:
+        if env.lower() in cls._DEV_ENVIRONMENTS:
             return cls.DISCORD_ALERT_CHANNEL_DEV_ID or cls.DISCORD_ALERT_CHANNEL_ID
         
         return cls.DISCORD_ALERT_CHANNEL_ID
@@ -104,12 +107,7 @@ class BotConfig:
     @classmethod
     def get_log_group_for_service(cls, service: str) -> Optional[str]:
         """Get CloudWatch log group for a service."""
-        service_map = {
-            "api": cls.CLOUDWATCH_LOG_GROUP_API,
-            "django": cls.CLOUDWATCH_LOG_GROUP_API,
-            "cloudfront": cls.CLOUDWATCH_LOG_GROUP_CLOUDFRONT,
-        }
-        return service_map.get(service.lower())
+        return cls._SERVICE_LOG_GROUPS.get(service.lower())
 
 
 config = BotConfig()
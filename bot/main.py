@@ -4,21 +4,32 @@ Main Discord bot for Jinkies monitoring system.
 import discord
 from discord.ext import commands
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
 from bot.config import config
 
-# Setup logging
+# Setup logging. The real handlers do blocking disk/console writes, so they
+# sit behind a QueueHandler drained by a background thread - log calls on the
+# event loop just enqueue a record instead of waiting on I/O.
+_log_queue = queue.Queue(-1)
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler("bot.log", mode="a", encoding="utf-8")
+]
+_log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+for handler in _log_handlers:
+    handler.setFormatter(_log_formatter)
+
 logging.basicConfig(
     level=getattr(logging, config.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("bot.log")
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+
 logger = logging.getLogger("jinkies")
 
 
@@ -36,6 +47,10 @@ class JinkiesBot(commands.Bot):
             intents=intents,
             description="Jinkies - AWS Monitoring & Alert Bot"
         )
+
+        # Cache of guild ID -> Nomad role ID so member joins don't have to
+        # linearly scan guild.roles on every event
+        self._nomad_role_ids = {}
     
     async def setup_hook(self):
         """Load cogs and sync commands."""
@@ -66,10 +81,22 @@ class JinkiesBot(commands.Bot):
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
     
+    def _cache_nomad_role(self, guild):
+        """Cache the Nomad role ID for a guild (or drop it if removed)."""
+        nomad_role = discord.utils.get(guild.roles, name="Nomad")
+        if nomad_role:
+            self._nomad_role_ids[guild.id] = nomad_role.id
+        else:
+            self._nomad_role_ids.pop(guild.id, None)
+
     async def on_ready(self):
         """Called when bot is ready."""
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
         logger.info(f"Connected to {len(self.guilds)} guild(s)")
+
+        # Cache role lookups for member joins
+        for guild in self.guilds:
+            self._cache_nomad_role(guild)
         
         # Set status
         await self.change_presence(
@@ -81,12 +108,29 @@ class JinkiesBot(commands.Bot):
         
         logger.info("Bot is ready!")
     
+    async def on_guild_join(self, guild):
+        """Cache roles for newly joined guilds."""
+        self._cache_nomad_role(guild)
+
+    async def on_guild_role_create(self, role):
+        """Refresh role cache when roles change."""
+        self._cache_nomad_role(role.guild)
+
+    async def on_guild_role_update(self, before, after):
+        """Refresh role cache when roles change."""
+        self._cache_nomad_role(after.guild)
+
+    async def on_guild_role_delete(self, role):
+        """Refresh role cache when roles change."""
+        self._cache_nomad_role(role.guild)
+
     async def on_member_join(self, member):
         """Auto-assign Nomad role when someone joins."""
         try:
             guild = member.guild
-            nomad_role = discord.utils.get(guild.roles, name="Nomad")
-            
+            role_id = self._nomad_role_ids.get(guild.id)
+            nomad_role = guild.get_role(role_id) if role_id else None
+
             if nomad_role:
                 await member.add_roles(nomad_role)
                 logger.info(f"Assigned Nomad role to {member.name} ({member.id})")
@@ -133,7 +177,8 @@ def main():
     
     # Create and run bot
     bot = JinkiesBot()
-    
+
+    log_listener.start()
     try:
         bot.run(config.DISCORD_BOT_TOKEN)
     except KeyboardInterrupt:
@@ -141,6 +186,8 @@ def main():
     except Exception as e:
         logger.error(f"Bot crashed: {e}")
         sys.exit(1)
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
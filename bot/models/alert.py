@@ -3,9 +3,33 @@ Data models for alerts and error tracking.
 """
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
+from hashlib import blake2b
 from typing import Optional, List, Dict, Any
-import uuid
+import itertools
 import json
+import os
+
+# ID generation: uuid4() costs an os.urandom() syscall per call, which adds up
+# when alerts are created in bursts. Seed once at import and mix in a counter.
+_ID_SEED = os.urandom(8)
+_ID_COUNTER = itertools.count()
+
+# Bound once at import so the timestamp default factories don't re-resolve
+# datetime.now / timezone.utc as globals on every Alert construction
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string."""
+    return datetime.now(_UTC).isoformat()
+
+
+def _new_alert_id() -> str:
+    """Generate a unique alert ID without a per-call urandom syscall."""
+    return blake2b(
+        _ID_SEED + next(_ID_COUNTER).to_bytes(8, "little"),
+        digest_size=16
+    ).hexdigest()
 
 
 @dataclass
@@ -13,8 +37,8 @@ class Alert:
     """Represents an alert notification from Django."""
     
     # Django alert reference
-    django_alert_id: str  # UUID from Django
-    alert_id: str = field(default_factory=lambda: str(uuid.uuid4()))  # Jinkies internal ID
+    django_alert_id: str = ""  # UUID from Django
+    alert_id: str = field(default_factory=_new_alert_id)  # Jinkies internal ID
     
     # Minimal alert data for display
     service_name: str = ""
@@ -24,12 +48,15 @@ class Alert:
     
     # For AI prompt generation
     stack_trace: str = ""
-    
+    related_logs: List[str] = field(default_factory=list)
+
     # Metadata
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    received_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: str = field(default_factory=_now_iso)
+    received_at: str = field(default_factory=_now_iso)
     environment: str = ""
     request_path: Optional[str] = None
+    instance_id: Optional[str] = None
+    commit_sha: Optional[str] = None
     
     # Jinkies tracking
     acknowledged: bool = False
@@ -78,16 +105,21 @@ class Alert:
         if not self.stack_trace:
             return ""
         
-        lines = self.stack_trace.split("\n")
-        if len(lines) <= max_lines:
-            return self.stack_trace
-        
-        return "\n".join(lines[:max_lines]) + f"\n... ({len(lines) - max_lines} more lines)"
+        # Scan for the first max_lines newlines instead of splitting the whole
+        # trace into a throwaway list; multi-KB traces are rendered often.
+        pos = 0
+        for _ in range(max_lines):
+            pos = self.stack_trace.find("\n", pos)
+            if pos == -1:
+                return self.stack_trace
+            pos += 1
+
+        remaining = self.stack_trace.count("\n", pos) + 1
+        return self.stack_trace[:pos - 1] + f"\n... ({remaining} more lines)"
     
     def get_trimmed_logs(self, max_lines: int = 10) -> List[str]:
         """Get trimmed related logs for display."""
-        # Logs are stored in Django, not here
-        return []
+        return self.related_logs[:max_lines]
     
     def get_django_url(self) -> str:
         """Get URL to view full alert in Django admin based on environment."""
@@ -97,16 +129,41 @@ class Alert:
         return f"{base_url}/admin/core/alert/{self.django_alert_id}/"
 
 
-@dataclass
 class LogEntry:
-    """Represents a single log entry."""
-    
-    timestamp: str
-    level: str
-    message: str
-    service: str = ""
-    stream_name: str = ""
-    
+    """Represents a single log entry.
+
+    Plain __slots__ class rather than a dataclass: these are allocated in
+    bulk on log-fetch paths, so per-instance __dict__ overhead matters.
+    The ISO timestamp is rendered lazily from timestamp_ms when a producer
+    only has the raw epoch value, since many entries are filtered out and
+    never displayed.
+    """
+
+    __slots__ = ("_timestamp", "level", "message", "service", "stream_name", "timestamp_ms")
+
+    def __init__(
+        self,
+        timestamp: str = "",
+        level: str = "INFO",
+        message: str = "",
+        service: str = "",
+        stream_name: str = "",
+        timestamp_ms: Optional[int] = None,
+    ):
+        self._timestamp = timestamp
+        self.level = level
+        self.message = message
+        self.service = service
+        self.stream_name = stream_name
+        self.timestamp_ms = timestamp_ms
+
+    @property
+    def timestamp(self) -> str:
+        """ISO timestamp, rendered on first access if only epoch ms was set."""
+        if not self._timestamp and self.timestamp_ms is not None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_ms / 1000).isoformat()
+        return self._timestamp
+
     def format_for_discord(self) -> str:
         """Format log entry for Discord display."""
         return f"[{self.level}] {self.timestamp} - {self.message}"
@@ -1,6 +1,6 @@
 """Services package."""
 from bot.services.alert_store import AlertStore
 from bot.services.cloudwatch import CloudWatchService
-from bot.services.github_service import GitHubService
+from bot.services.github_service import GitHubService, AsyncGitHubService
 
-__all__ = ["AlertStore", "CloudWatchService", "GitHubService"]
+__all__ = ["AlertStore", "CloudWatchService", "GitHubService", "AsyncGitHubService"]
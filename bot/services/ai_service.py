@@ -23,6 +23,25 @@ class AIService:
         else:
             self.client = OpenAI(api_key=api_key)
     
+    # Cap the serialized context included in prompts; anything beyond this
+    # just inflates token count (and cost/latency) without helping the model
+    MAX_CONTEXT_CHARS = 4096
+
+    @staticmethod
+    def _format_context(context: Dict[str, Any]) -> str:
+        """Serialize additional context compactly for the prompt.
+
+        Indented JSON roughly doubles the token count sent to the model,
+        so use compact separators and truncate oversized payloads.
+        """
+        if not context:
+            return "None"
+
+        dumped = json.dumps(context, separators=(",", ":"))
+        if len(dumped) > AIService.MAX_CONTEXT_CHARS:
+            dumped = dumped[:AIService.MAX_CONTEXT_CHARS] + "... (truncated)"
+        return dumped
+
     def generate_fix_prompt(self, alert: Alert) -> Optional[str]:
         """
         Generate a structured fix prompt from an alert.
@@ -67,7 +86,7 @@ Output a structured markdown document that Copilot can use to implement the fix.
 
 ## Additional Context
 ```json
-{json.dumps(alert.additional_context, indent=2) if alert.additional_context else 'None'}
+{self._format_context(alert.additional_context)}
 ```
 
 Generate a comprehensive fix prompt with:
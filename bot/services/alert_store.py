@@ -4,12 +4,25 @@ Stores alerts in a SQLite database for persistence and querying.
 """
 import sqlite3
 import json
+import logging
+import time
 from typing import List, Optional
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from bot.models.alert import Alert
 
+logger = logging.getLogger("jinkies.store")
+
+# Explicit column list so reads can use positional access in _row_to_alert
+# (sqlite3.Row name lookups scan the column list per access)
+_COLS = (
+    "alert_id, django_alert_id, service_name, exception_type, error_message, "
+    "stack_trace, request_path, timestamp, received_at, environment, "
+    "acknowledged, acknowledged_by, acknowledged_at, github_pr_url, "
+    "github_issue_url, severity, additional_context"
+)
+
 
 class AlertStore:
     """Manages alert persistence and retrieval."""
@@ -17,11 +30,14 @@ class AlertStore:
     def __init__(self, db_path: str = "alerts.db"):
         """Initialize alert store with database path."""
         self.db_path = db_path
+        # file: URIs (e.g. shared-cache in-memory databases in tests)
+        # need uri=True on every connect
+        self._uri = db_path.startswith("file:")
         self._init_database()
     
     def _init_database(self):
         """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, uri=self._uri)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -47,63 +63,84 @@ class AlertStore:
             )
         """)
         
-        # Create indexes for common queries
+        # Create indexes for common queries. The list queries all do
+        # "WHERE <col> = ? ORDER BY timestamp DESC", so composite indexes
+        # with a trailing timestamp DESC let SQLite skip the sort step.
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_django_alert ON alerts(django_alert_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON alerts(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_service ON alerts(service_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ts_desc ON alerts(timestamp DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_service_ts ON alerts(service_name, timestamp DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_severity ON alerts(severity)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_acknowledged ON alerts(acknowledged)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ack_ts ON alerts(acknowledged, timestamp DESC)")
+
+        # Drop superseded single-column indexes (cheaper writes on save_alert)
+        cursor.execute("DROP INDEX IF EXISTS idx_timestamp")
+        cursor.execute("DROP INDEX IF EXISTS idx_service")
+        cursor.execute("DROP INDEX IF EXISTS idx_acknowledged")
         
         conn.commit()
         conn.close()
     
+    # Retries for SQLITE_BUSY-style transient failures on writes
+    MAX_WRITE_RETRIES = 3
+
     def save_alert(self, alert: Alert) -> bool:
         """Save an alert to the database."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO alerts (
-                    alert_id, django_alert_id, service_name, exception_type, error_message,
-                    stack_trace, request_path, timestamp, received_at,
-                    environment, acknowledged, acknowledged_by, acknowledged_at,
-                    github_pr_url, github_issue_url, severity, additional_context
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                alert.alert_id,
-                alert.django_alert_id,
-                alert.service_name,
-                alert.exception_type,
-                alert.error_message,
-                alert.stack_trace,
-                alert.request_path,
-                alert.timestamp,
-                alert.received_at,
-                alert.environment,
-                int(alert.acknowledged),
-                alert.acknowledged_by,
-                alert.acknowledged_at,
-                alert.github_pr_url,
-                alert.github_issue_url,
-                alert.severity,
-                json.dumps(alert.additional_context)
-            ))
-            
-            conn.commit()
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"Error saving alert: {e}")
-            return False
+        for attempt in range(self.MAX_WRITE_RETRIES):
+            try:
+                return self._save_alert_once(alert)
+            except sqlite3.OperationalError:
+                # Database locked by a concurrent writer; back off and retry
+                if attempt == self.MAX_WRITE_RETRIES - 1:
+                    logger.exception("save_alert failed after %d attempts", self.MAX_WRITE_RETRIES)
+                    return False
+                time.sleep(0.01 * 2 ** attempt)
+            except Exception:
+                logger.exception("save_alert failed")
+                return False
+        return False
+
+    def _save_alert_once(self, alert: Alert) -> bool:
+        """Perform a single save attempt."""
+        conn = sqlite3.connect(self.db_path, uri=self._uri)
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            INSERT OR REPLACE INTO alerts (
+                alert_id, django_alert_id, service_name, exception_type, error_message,
+                stack_trace, request_path, timestamp, received_at,
+                environment, acknowledged, acknowledged_by, acknowledged_at,
+                github_pr_url, github_issue_url, severity, additional_context
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            alert.alert_id,
+            alert.django_alert_id,
+            alert.service_name,
+            alert.exception_type,
+            alert.error_message,
+            alert.stack_trace,
+            alert.request_path,
+            alert.timestamp,
+            alert.received_at,
+            alert.environment,
+            int(alert.acknowledged),
+            alert.acknowledged_by,
+            alert.acknowledged_at,
+            alert.github_pr_url,
+            alert.github_issue_url,
+            alert.severity,
+            json.dumps(alert.additional_context)
+        ))
+
+        conn.commit()
+        conn.close()
+        return True
     
     def get_alert(self, alert_id: str) -> Optional[Alert]:
         """Retrieve an alert by ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = sqlite3.connect(self.db_path, uri=self._uri)
         cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM alerts WHERE alert_id = ?", (alert_id,))
+
+        cursor.execute(f"SELECT {_COLS} FROM alerts WHERE alert_id = ?", (alert_id,))
         row = cursor.fetchone()
         conn.close()
         
@@ -114,46 +151,46 @@ class AlertStore:
     
     def get_recent_alerts(self, limit: int = 10, acknowledged: Optional[bool] = None) -> List[Alert]:
         """Get recent alerts, optionally filtered by acknowledgement status."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = sqlite3.connect(self.db_path, uri=self._uri)
         cursor = conn.cursor()
-        
+
         if acknowledged is None:
             cursor.execute(
-                "SELECT * FROM alerts ORDER BY timestamp DESC LIMIT ?",
+                f"SELECT {_COLS} FROM alerts ORDER BY timestamp DESC LIMIT ?",
                 (limit,)
             )
         else:
             cursor.execute(
-                "SELECT * FROM alerts WHERE acknowledged = ? ORDER BY timestamp DESC LIMIT ?",
+                f"SELECT {_COLS} FROM alerts WHERE acknowledged = ? ORDER BY timestamp DESC LIMIT ?",
                 (int(acknowledged), limit)
             )
         
-        rows = cursor.fetchall()
+        # Iterate the cursor directly instead of fetchall() so rows aren't
+        # materialized twice (driver buffer + Alert list)
+        alerts = list(map(self._row_to_alert, cursor))
         conn.close()
-        
-        return [self._row_to_alert(row) for row in rows]
-    
+
+        return alerts
+
     def get_alerts_by_service(self, service_name: str, limit: int = 10) -> List[Alert]:
         """Get alerts for a specific service."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = sqlite3.connect(self.db_path, uri=self._uri)
         cursor = conn.cursor()
-        
+
         cursor.execute(
-            "SELECT * FROM alerts WHERE service_name = ? ORDER BY timestamp DESC LIMIT ?",
+            f"SELECT {_COLS} FROM alerts WHERE service_name = ? ORDER BY timestamp DESC LIMIT ?",
             (service_name, limit)
         )
         
-        rows = cursor.fetchall()
+        alerts = list(map(self._row_to_alert, cursor))
         conn.close()
-        
-        return [self._row_to_alert(row) for row in rows]
-    
+
+        return alerts
+
     def acknowledge_alert(self, alert_id: str, acknowledged_by: str) -> bool:
         """Mark an alert as acknowledged."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, uri=self._uri)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -167,14 +204,14 @@ class AlertStore:
             conn.commit()
             conn.close()
             return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error acknowledging alert: {e}")
+        except Exception:
+            logger.exception("acknowledge_alert failed")
             return False
     
     def update_github_links(self, alert_id: str, pr_url: Optional[str] = None, issue_url: Optional[str] = None) -> bool:
         """Update GitHub PR/issue URLs for an alert."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, uri=self._uri)
             cursor = conn.cursor()
             
             updates = []
@@ -198,8 +235,8 @@ class AlertStore:
             conn.commit()
             conn.close()
             return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error updating GitHub links: {e}")
+        except Exception:
+            logger.exception("update_github_links failed")
             return False
     
     def cleanup_old_alerts(self, days: int = 30) -> int:
@@ -207,7 +244,7 @@ class AlertStore:
         try:
             cutoff_date = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
             
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, uri=self._uri)
             cursor = conn.cursor()
             
             cursor.execute("DELETE FROM alerts WHERE timestamp < ?", (cutoff_date,))
@@ -217,28 +254,28 @@ class AlertStore:
             conn.close()
             
             return deleted_count
-        except Exception as e:
-            print(f"Error cleaning up alerts: {e}")
+        except Exception:
+            logger.exception("cleanup_old_alerts failed")
             return 0
     
-    def _row_to_alert(self, row: sqlite3.Row) -> Alert:
-        """Convert a database row to an Alert object."""
+    def _row_to_alert(self, row: tuple) -> Alert:
+        """Convert a database row (ordered as _COLS) to an Alert object."""
         return Alert(
-            alert_id=row["alert_id"],
-            django_alert_id=row["django_alert_id"],
-            service_name=row["service_name"],
-            exception_type=row["exception_type"] or "",
-            error_message=row["error_message"] or "",
-            stack_trace=row["stack_trace"] or "",
-            request_path=row["request_path"],
-            timestamp=row["timestamp"],
-            received_at=row["received_at"],
-            environment=row["environment"] or "",
-            acknowledged=bool(row["acknowledged"]),
-            acknowledged_by=row["acknowledged_by"],
-            acknowledged_at=row["acknowledged_at"],
-            github_pr_url=row["github_pr_url"],
-            github_issue_url=row["github_issue_url"],
-            severity=row["severity"] or "ERROR",
-            additional_context=json.loads(row["additional_context"]) if row["additional_context"] else {}
+            alert_id=row[0],
+            django_alert_id=row[1],
+            service_name=row[2],
+            exception_type=row[3] or "",
+            error_message=row[4] or "",
+            stack_trace=row[5] or "",
+            request_path=row[6],
+            timestamp=row[7],
+            received_at=row[8],
+            environment=row[9] or "",
+            acknowledged=row[10] != 0,
+            acknowledged_by=row[11],
+            acknowledged_at=row[12],
+            github_pr_url=row[13],
+            github_issue_url=row[14],
+            severity=row[15] or "ERROR",
+            additional_context=json.loads(row[16]) if row[16] else {}
         )
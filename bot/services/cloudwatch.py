@@ -6,18 +6,32 @@ NOTE: This module is OPTIONAL. CloudWatch integration is not required
 for basic Jinkies functionality. If you're using Django webhooks and
 don't need CloudWatch, you can skip installing boto3.
 """
+import asyncio
+import functools
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any
+from bot.config import config
+from bot.models.alert import LogEntry
+
+logger = logging.getLogger("jinkies.cloudwatch")
+
 try:
     import boto3
+    from botocore.config import Config
     CLOUDWATCH_AVAILABLE = True
 except ImportError:
     CLOUDWATCH_AVAILABLE = False
-    print("Warning: boto3 not installed. CloudWatch integration disabled.")
-    print("Install boto3 to enable CloudWatch: pip install boto3")
+    logger.warning(
+        "boto3 not installed - CloudWatch integration disabled. "
+        "Install boto3 to enable it: pip install boto3"
+    )
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from bot.config import config
-from bot.models.alert import LogEntry
+# Single-pass, case-insensitive scan for the first level token in a message
+_LEVEL_RE = re.compile(r"CRITICAL|ERROR|WARNING|INFO|DEBUG", re.IGNORECASE)
 
 
 class CloudWatchService:
@@ -37,8 +51,54 @@ class CloudWatchService:
             session_params["aws_access_key_id"] = config.AWS_ACCESS_KEY_ID
             session_params["aws_secret_access_key"] = config.AWS_SECRET_ACCESS_KEY
         
-        self.client = boto3.client("logs", **session_params)
-    
+        # Pool and keep connections alive so repeated queries (tail polling
+        # especially) reuse sockets instead of paying a TLS handshake each
+        # call. Pool size matches the worst case of concurrent executor
+        # threads plus tail sessions.
+        client_config = Config(
+            max_pool_connections=50,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            tcp_keepalive=True,
+            connect_timeout=3,
+            read_timeout=30,
+        )
+        self.client = boto3.client("logs", config=client_config, **session_params)
+
+        # boto3 is synchronous; async callers run queries through this pool
+        # so CloudWatch round-trips don't block the event loop
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cloudwatch")
+
+        # Highest event timestamp seen per log group, so tail polls never
+        # re-fetch (and re-pay for) events already delivered
+        self._tail_cursors: Dict[str, int] = {}
+
+        # describe_log_streams / describe_log_groups results change rarely
+        # compared to poll frequency; cache them briefly so dashboards and
+        # tail sessions don't pay an API round-trip per call
+        self._stream_cache: Dict[tuple, tuple] = {}
+        self._group_cache: Dict[str, tuple] = {}
+
+    async def _run_sync(self, func, *args, **kwargs):
+        """Run a blocking call on the executor from async code."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def get_logs_async(self, *args, **kwargs) -> List[LogEntry]:
+        """Async wrapper for get_logs (runs on the executor)."""
+        return await self._run_sync(self.get_logs, *args, **kwargs)
+
+    async def tail_logs_async(self, *args, **kwargs) -> tuple:
+        """Async wrapper for tail_logs (runs on the executor).
+
+        Returns the same (new LogEntry objects, highest event timestamp
+        in ms) tuple as tail_logs.
+        """
+        return await self._run_sync(self.tail_logs, *args, **kwargs)
+
+    async def get_log_streams_async(self, *args, **kwargs) -> List[str]:
+        """Async wrapper for get_log_streams (runs on the executor)."""
+        return await self._run_sync(self.get_log_streams, *args, **kwargs)
+
     def get_logs(
         self,
         log_group: str,
@@ -76,52 +136,243 @@ class CloudWatchService:
                 "logGroupName": log_group,
                 "startTime": int(start_time.timestamp() * 1000),
                 "endTime": int(end_time.timestamp() * 1000),
-                "limit": limit,
             }
-            
+
             if filter_pattern:
                 params["filterPattern"] = filter_pattern
-            
-            # Get log streams
+
+            # Use the official paginator: filter_log_events can return a
+            # nextToken with an empty events page, which the old manual loop
+            # kept re-requesting. MaxItems also stops at limit for us.
             log_entries = []
-            
-            response = self.client.filter_log_events(**params)
-            
-            for event in response.get("events", []):
-                log_entries.append(
-                    LogEntry(
-                        timestamp=datetime.fromtimestamp(event["timestamp"] / 1000).isoformat(),
-                        level=self._extract_log_level(event["message"]),
-                        message=event["message"],
-                        stream_name=event.get("logStreamName", ""),
-                    )
-                )
-            
-            # Handle pagination if needed
-            while "nextToken" in response and len(log_entries) < limit:
-                params["nextToken"] = response["nextToken"]
-                response = self.client.filter_log_events(**params)
-                
-                for event in response.get("events", []):
+            paginator = self.client.get_paginator("filter_log_events")
+            page_iterator = paginator.paginate(
+                **params,
+                PaginationConfig={"MaxItems": limit, "PageSize": min(limit, 1000)}
+            )
+
+            for page in page_iterator:
+                for event in page.get("events", []):
                     if len(log_entries) >= limit:
                         break
                     log_entries.append(
                         LogEntry(
-                            timestamp=datetime.fromtimestamp(event["timestamp"] / 1000).isoformat(),
+                            timestamp_ms=event["timestamp"],
                             level=self._extract_log_level(event["message"]),
                             message=event["message"],
                             stream_name=event.get("logStreamName", ""),
                         )
                     )
-            
-            return log_entries[:limit]
+                if len(log_entries) >= limit:
+                    break
+
+            return log_entries
         
-        except Exception as e:
-            print(f"Error fetching CloudWatch logs: {e}")
+        except Exception:
+            logger.exception("Error fetching CloudWatch logs")
             return []
     
+    # Concurrent sub-window fetches allowed per fan-out query (respects
+    # CloudWatch throttling; adaptive retry mode absorbs the rest)
+    MAX_CONCURRENT_SHARDS = 8
+
+    async def get_logs_fanout_async(
+        self,
+        log_group: str,
+        log_level: Optional[str] = None,
+        since_minutes: int = 60,
+        limit: int = 50,
+        filter_pattern: Optional[str] = None,
+        shards: int = MAX_CONCURRENT_SHARDS
+    ) -> List[LogEntry]:
+        """
+        Retrieve logs by fetching equal time sub-windows concurrently.
+
+        Pagination in get_logs is strictly serial, so large windows pay one
+        round-trip per page back to back. This splits the window into
+        `shards` sub-ranges and fetches them with asyncio.gather (bounded by
+        a semaphore), then merges by timestamp and truncates to limit.
+        """
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(minutes=since_minutes)
+        start_ms = int(start_time.timestamp() * 1000)
+        end_ms = int(end_time.timestamp() * 1000)
+
+        if not filter_pattern and log_level:
+            filter_pattern = f"[{log_level}]"
+
+        step = max((end_ms - start_ms) // shards, 1)
+        windows = [
+            (start_ms + i * step, min(start_ms + (i + 1) * step, end_ms))
+            for i in range(shards)
+            if start_ms + i * step < end_ms
+        ]
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SHARDS)
+
+        async def fetch_window(window_start: int, window_end: int) -> List[LogEntry]:
+            async with semaphore:
+                return await self._run_sync(
+                    self._fetch_events, log_group, window_start, window_end,
+                    filter_pattern, limit
+                )
+
+        pages = await asyncio.gather(*(fetch_window(s, e) for s, e in windows))
+
+        entries = [entry for page in pages for entry in page]
+        entries.sort(key=lambda entry: entry.timestamp_ms or 0)
+        return entries[:limit]
+
+    def _fetch_events(
+        self,
+        log_group: str,
+        start_ms: int,
+        end_ms: int,
+        filter_pattern: Optional[str],
+        limit: int
+    ) -> List[LogEntry]:
+        """Fetch events for one time window (runs on the executor)."""
+        params = {
+            "logGroupName": log_group,
+            "startTime": start_ms,
+            "endTime": end_ms,
+        }
+        if filter_pattern:
+            params["filterPattern"] = filter_pattern
+
+        entries = []
+        paginator = self.client.get_paginator("filter_log_events")
+        page_iterator = paginator.paginate(
+            **params,
+            PaginationConfig={"MaxItems": limit, "PageSize": min(limit, 1000)}
+        )
+        for page in page_iterator:
+            for event in page.get("events", []):
+                if len(entries) >= limit:
+                    return entries
+                entries.append(
+                    LogEntry(
+                        timestamp_ms=event["timestamp"],
+                        level=self._extract_log_level(event["message"]),
+                        message=event["message"],
+                        stream_name=event.get("logStreamName", ""),
+                    )
+                )
+        return entries
+
+    # Logs Insights accepts at most this many log groups per StartQuery call
+    MAX_GROUPS_PER_QUERY = 50
+
+    def get_logs_batch(
+        self,
+        log_groups: List[str],
+        log_level: Optional[str] = None,
+        since_minutes: int = 60,
+        limit: int = 50
+    ) -> Dict[str, List[LogEntry]]:
+        """
+        Retrieve logs from several log groups with batched Insights queries.
+
+        Querying group-by-group costs one filter_log_events round-trip per
+        group; StartQuery takes up to 50 groups per request, so N groups
+        collapse into ceil(N/50) API calls.
+
+        Args:
+            log_groups: CloudWatch log group names
+            log_level: Filter by log level (INFO, WARNING, ERROR, CRITICAL)
+            since_minutes: How many minutes back to search
+            limit: Maximum number of log entries to return per group
+
+        Returns:
+            Dict mapping log group name to its LogEntry list
+        """
+        try:
+            end_time = datetime.utcnow()
+            start_time = end_time - timedelta(minutes=since_minutes)
+
+            # Pre-filter to groups that actually exist so one bad name
+            # doesn't fail the whole batch
+            existing = [g for g in log_groups if self.test_connection(g)]
+            if not existing:
+                return {}
+
+            query = "fields @timestamp, @message, @logStream, @log"
+            if log_level:
+                query += f" | filter @message like /{log_level}/"
+            query += f" | sort @timestamp desc | limit {limit * len(existing)}"
+
+            results: Dict[str, List[LogEntry]] = {group: [] for group in existing}
+
+            for i in range(0, len(existing), self.MAX_GROUPS_PER_QUERY):
+                chunk = existing[i:i + self.MAX_GROUPS_PER_QUERY]
+                response = self.client.start_query(
+                    logGroupNames=chunk,
+                    startTime=int(start_time.timestamp()),
+                    endTime=int(end_time.timestamp()),
+                    queryString=query,
+                )
+
+                for row in self._wait_for_query(response["queryId"]):
+                    fields = {f["field"]: f["value"] for f in row}
+                    # @log is "account:group-name"; partition results by group
+                    group = fields.get("@log", "").split(":", 1)[-1]
+                    entries = results.get(group)
+                    if entries is None or len(entries) >= limit:
+                        continue
+                    message = fields.get("@message", "")
+                    entries.append(
+                        LogEntry(
+                            timestamp=fields.get("@timestamp", ""),
+                            level=self._extract_log_level(message),
+                            message=message,
+                            stream_name=fields.get("@logStream", ""),
+                        )
+                    )
+
+            return results
+
+        except Exception:
+            logger.exception("Error fetching batched CloudWatch logs")
+            return {}
+
+    def _wait_for_query(self, query_id: str, timeout: float = 30.0) -> List[List[Dict[str, str]]]:
+        """Poll an Insights query until it completes, with backoff.
+
+        Returns an empty result set (and logs why) when the query fails,
+        is cancelled, or doesn't finish within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            response = self.client.get_query_results(queryId=query_id)
+            status = response["status"]
+            if status == "Complete":
+                return response.get("results", [])
+            if status in ("Failed", "Cancelled"):
+                logger.warning(f"Insights query {query_id} ended with status {status}")
+                return []
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        # Don't leave an abandoned query running against the account's
+        # concurrency limit
+        logger.warning(f"Insights query {query_id} timed out after {timeout}s; stopping it")
+        try:
+            self.client.stop_query(queryId=query_id)
+        except Exception:
+            logger.exception("Failed to stop timed-out Insights query")
+        return []
+
+    # How long cached describe_* results stay fresh, in seconds
+    DESCRIBE_CACHE_TTL = 60.0
+
     def get_log_streams(self, log_group: str, limit: int = 10) -> List[str]:
-        """Get available log streams in a log group."""
+        """Get available log streams in a log group (cached for 60s)."""
+        cache_key = (log_group, limit)
+        cached = self._stream_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.DESCRIBE_CACHE_TTL:
+            return cached[1]
+
         try:
             response = self.client.describe_log_streams(
                 logGroupName=log_group,
@@ -129,10 +380,13 @@ class CloudWatchService:
                 descending=True,
                 limit=limit
             )
-            
-            return [stream["logStreamName"] for stream in response.get("logStreams", [])]
-        except Exception as e:
-            print(f"Error fetching log streams: {e}")
+
+            streams = [stream["logStreamName"] for stream in response.get("logStreams", [])]
+            self._stream_cache[cache_key] = (time.monotonic(), streams)
+            return streams
+        except Exception:
+            self._stream_cache.pop(cache_key, None)
+            logger.exception("Error fetching log streams")
             return []
     
     def tail_logs(
@@ -140,31 +394,35 @@ class CloudWatchService:
         log_group: str,
         log_level: Optional[str] = None,
         last_seen_timestamp: Optional[int] = None
-    ) -> List[LogEntry]:
+    ) -> tuple:
         """
         Get new logs since last seen timestamp (for tailing).
-        
+
         Args:
             log_group: CloudWatch log group name
             log_level: Filter by log level
-            last_seen_timestamp: Unix timestamp (ms) of last seen log
-        
+            last_seen_timestamp: Unix timestamp (ms) of last seen log;
+                falls back to the per-group cursor cached on this service
+
         Returns:
-            List of new LogEntry objects
+            Tuple of (new LogEntry objects, highest event timestamp in ms)
         """
         try:
-            # Start from last seen or 1 minute ago
+            # Start from the caller's cursor, then our cached per-group
+            # cursor, then 1 minute ago
+            if last_seen_timestamp is None:
+                last_seen_timestamp = self._tail_cursors.get(log_group)
+
             if last_seen_timestamp:
                 start_time = last_seen_timestamp + 1  # +1ms to avoid duplicates
             else:
                 start_time = int((datetime.utcnow() - timedelta(minutes=1)).timestamp() * 1000)
-            
-            end_time = int(datetime.utcnow().timestamp() * 1000)
-            
+
+            # No endTime: events landing while the call is in flight are
+            # picked up by the next poll instead of being skipped
             params = {
                 "logGroupName": log_group,
                 "startTime": start_time,
-                "endTime": end_time,
                 "limit": 100,
             }
             
@@ -177,32 +435,59 @@ class CloudWatchService:
             for event in response.get("events", []):
                 log_entries.append(
                     LogEntry(
-                        timestamp=datetime.fromtimestamp(event["timestamp"] / 1000).isoformat(),
+                        timestamp_ms=event["timestamp"],
                         level=self._extract_log_level(event["message"]),
                         message=event["message"],
                         stream_name=event.get("logStreamName", ""),
                     )
                 )
             
-            return log_entries
-        
-        except Exception as e:
-            print(f"Error tailing logs: {e}")
-            return []
+            max_ts = max(
+                (event["timestamp"] for event in response.get("events", [])),
+                default=last_seen_timestamp or 0
+            )
+            self._tail_cursors[log_group] = max_ts
+
+            return log_entries, max_ts
+
+        except Exception:
+            logger.exception("Error tailing logs")
+            return [], last_seen_timestamp or 0
     
     def _extract_log_level(self, message: str) -> str:
         """Extract log level from message."""
-        message_upper = message.upper()
-        for level in ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"]:
-            if level in message_upper:
-                return level
-        return "INFO"
+        match = _LEVEL_RE.search(message)
+        return match.group(0).upper() if match else "INFO"
     
     def test_connection(self, log_group: str) -> bool:
-        """Test connection to CloudWatch and verify log group exists."""
+        """Test connection to CloudWatch and verify log group exists.
+
+        Positive results are cached for an hour - log groups effectively
+        never disappear - while failures are re-probed every call.
+        """
+        cached = self._group_cache.get(log_group)
+        if cached and time.monotonic() - cached[0] < 3600:
+            return cached[1]
+
         try:
-            self.client.describe_log_groups(logGroupNamePrefix=log_group, limit=1)
-            return True
-        except Exception as e:
-            print(f"CloudWatch connection test failed: {e}")
+            # describe_log_groups matches by prefix and sorts ascending,
+            # so an exact match (the shortest name with this prefix) is
+            # always first when it exists - but the call itself succeeds
+            # for nonexistent groups, so the response must be inspected
+            response = self.client.describe_log_groups(
+                logGroupNamePrefix=log_group, limit=1
+            )
+            exists = any(
+                group["logGroupName"] == log_group
+                for group in response.get("logGroups", [])
+            )
+            if exists:
+                self._group_cache[log_group] = (time.monotonic(), True)
+            else:
+                self._group_cache.pop(log_group, None)
+                logger.warning(f"CloudWatch log group not found: {log_group}")
+            return exists
+        except Exception:
+            self._group_cache.pop(log_group, None)
+            logger.exception("CloudWatch connection test failed")
             return False
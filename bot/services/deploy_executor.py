@@ -3,12 +3,21 @@ Deployment execution service - runs deployments directly without GitHub Actions.
 """
 import asyncio
 import logging
+import os
+from collections import deque
 from typing import Optional, Dict, Any
 from pathlib import Path
 import subprocess
 
 logger = logging.getLogger("jinkies.deploy_executor")
 
+# Lines of stdout/stderr retained per command; enough for Discord log
+# posts without holding a whole deploy's output in memory
+MAX_OUTPUT_LINES = 500
+
+# AWS credentials forwarded to the deploy script when present
+AWS_VARS = ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN", "AWS_DEFAULT_REGION")
+
 
 class DeploymentExecutor:
     """Executes deployments by running deployment scripts."""
@@ -27,7 +36,30 @@ class DeploymentExecutor:
         self.ssh_key_path = ssh_key_path
         self.ec2_host = ec2_host
         self.ec2_user = ec2_user
-        
+
+        # ControlMaster/ControlPersist multiplexes repeated SSH calls over
+        # one TCP connection, so back-to-back status checks skip the
+        # ~200-800ms handshake after the first
+        self._ssh_base = [
+            "ssh",
+            "-o", "ControlMaster=auto",
+            "-o", "ControlPersist=60s",
+            "-o", "ControlPath=/tmp/jinkies-ssh-%r@%h:%p",
+            "-i", self.ssh_key_path,
+            f"{self.ec2_user}@{self.ec2_host}",
+        ]
+
+        # The deploy script environment never changes between calls, so
+        # assemble it once instead of re-copying os.environ per deploy
+        self._base_env = {
+            "DEPLOY_REPO_PATH": str(self.repo_path),
+            "DEPLOY_SSH_KEY": self.ssh_key_path,
+            "DEPLOY_EC2_HOST": self.ec2_host,
+            "DEPLOY_EC2_USER": self.ec2_user,
+            **{var: os.environ[var] for var in ("HOME", "PATH") if var in os.environ},
+            **{var: os.environ[var] for var in AWS_VARS if var in os.environ},
+        }
+
     async def deploy(self, branch: str = "develop") -> Dict[str, Any]:
         """
         Execute deployment for specified branch.
@@ -41,38 +73,23 @@ class DeploymentExecutor:
         logger.info(f"Starting deployment of branch: {branch}")
         
         try:
-            # Pull latest changes
-            await self._run_command(f"cd {self.repo_path} && git fetch origin")
-            await self._run_command(f"cd {self.repo_path} && git checkout {branch}")
-            await self._run_command(f"cd {self.repo_path} && git pull origin {branch}")
+            # Sync to the remote branch tip: one fetch of just that branch,
+            # then reset the local branch onto FETCH_HEAD. This contacts the
+            # remote once (the old fetch+checkout+pull hit it twice) and
+            # can't fail on merge conflicts from a dirty deploy host.
+            await self._run_command(["git", "fetch", "origin", branch], cwd=self.repo_path)
+            await self._run_command(["git", "checkout", "-B", branch, "FETCH_HEAD"], cwd=self.repo_path)
             
             # Run Jinkies deployment script (not from the repo)
-            import os
             jinkies_path = Path(__file__).parent.parent.parent  # Go up to jinkies root
             deploy_script = jinkies_path / "scripts" / "deploy-nomadic.sh"
             
             if not deploy_script.exists():
                 raise FileNotFoundError(f"Deployment script not found: {deploy_script}")
             
-            # Set environment variables for deployment
-            import os
-            env = {
-                "DEPLOY_REPO_PATH": str(self.repo_path),
-                "DEPLOY_SSH_KEY": self.ssh_key_path,
-                "DEPLOY_EC2_HOST": self.ec2_host,
-                "DEPLOY_EC2_USER": self.ec2_user,
-                "HOME": os.environ.get("HOME", ""),
-                "PATH": os.environ.get("PATH", ""),
-            }
-            
-            # Pass AWS credentials if available
-            for aws_var in ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN", "AWS_DEFAULT_REGION"]:
-                if aws_var in os.environ:
-                    env[aws_var] = os.environ[aws_var]
-            
             result = await self._run_command(
-                str(deploy_script),
-                env=env,
+                [str(deploy_script)],
+                env=self._base_env,
                 timeout=600  # 10 minute timeout
             )
             
@@ -102,64 +119,96 @@ class DeploymentExecutor:
     
     async def _run_command(
         self,
-        command: str,
+        argv: list,
+        cwd: Optional[Path] = None,
         env: Optional[Dict[str, str]] = None,
         timeout: int = 300
     ) -> Dict[str, str]:
         """
-        Run a shell command asynchronously.
-        
+        Run a command asynchronously without a shell.
+
         Args:
-            command: Command to run
+            argv: Command and arguments as a list
+            cwd: Working directory for the command
             env: Environment variables
             timeout: Command timeout in seconds
-            
+
         Returns:
             Dict with stdout and stderr
         """
-        logger.debug(f"Running command: {command}")
-        
+        logger.debug(f"Running command: {argv}")
+
         # Merge with current environment
-        import os
         full_env = os.environ.copy()
         if env:
             full_env.update(env)
-        
-        process = await asyncio.create_subprocess_shell(
-            command,
+
+        # exec instead of shell: no /bin/sh fork per command, and branch
+        # names can't be interpreted as shell syntax
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=cwd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             env=full_env
         )
-        
+
+        # Drain both pipes line by line as the process runs instead of
+        # buffering everything with communicate(): long deploys stream
+        # progress to the logger immediately and peak memory stays bounded
+        # by the deques instead of growing with total output.
+        stdout_lines = deque(maxlen=MAX_OUTPUT_LINES)
+        stderr_lines = deque(maxlen=MAX_OUTPUT_LINES)
+
+        async def drain(stream, lines):
+            # Read fixed-size chunks and split lines ourselves: iterating
+            # the stream line-by-line raises once a single line exceeds
+            # the 64KiB StreamReader limit (minified JS in build output,
+            # for instance), failing a deploy that actually succeeded
+            pending = b""
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    break
+                *complete, pending = (pending + chunk).split(b"\n")
+                for raw_line in complete:
+                    line = raw_line.decode(errors="replace")
+                    lines.append(line)
+                    logger.debug(line)
+            if pending:
+                line = pending.decode(errors="replace")
+                lines.append(line)
+                logger.debug(line)
+
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            await asyncio.wait_for(
+                asyncio.gather(
+                    drain(process.stdout, stdout_lines),
+                    drain(process.stderr, stderr_lines),
+                    process.wait()
+                ),
                 timeout=timeout
             )
-            
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
-                stdout_msg = stdout.decode() if stdout else ""
-                logger.error(f"Command failed with exit code {process.returncode}")
-                logger.error(f"STDOUT: {stdout_msg[-500:]}")  # Last 500 chars
-                logger.error(f"STDERR: {error_msg[-500:]}")  # Last 500 chars
-                raise subprocess.CalledProcessError(
-                    process.returncode,
-                    command,
-                    output=stdout,
-                    stderr=stderr
-                )
-            
-            return {
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else ""
-            }
-            
         except asyncio.TimeoutError:
             process.kill()
             await process.wait()
-            raise subprocess.TimeoutExpired(command, timeout)
+            raise subprocess.TimeoutExpired(argv, timeout)
+
+        stdout = "\n".join(stdout_lines)
+        stderr = "\n".join(stderr_lines)
+
+        if process.returncode != 0:
+            logger.error(f"Command failed with exit code {process.returncode}")
+            logger.error(f"STDOUT: {stdout[-500:]}")  # Last 500 chars
+            logger.error(f"STDERR: {stderr[-500:]}")  # Last 500 chars
+            raise subprocess.CalledProcessError(
+                process.returncode,
+                argv,
+                output=stdout,
+                stderr=stderr
+            )
+
+        return {"stdout": stdout, "stderr": stderr}
     
     async def get_deployment_status(self) -> Dict[str, Any]:
         """
@@ -169,24 +218,24 @@ class DeploymentExecutor:
             Dict with deployment status information
         """
         try:
-            # Check if gunicorn is running
+            # One remote shell answers both questions (gunicorn liveness and
+            # last deployed commit) in a single round-trip; the marker line
+            # separates the two outputs
             result = await self._run_command(
-                f"ssh -i {self.ssh_key_path} {self.ec2_user}@{self.ec2_host} 'pgrep -f gunicorn'",
-                timeout=30
-            )
-            
-            is_running = bool(result["stdout"].strip())
-            
-            # Get last deployment time from git
-            git_result = await self._run_command(
-                f"ssh -i {self.ssh_key_path} {self.ec2_user}@{self.ec2_host} "
-                f"'cd /opt/nomadic-influence/backend && git log -1 --format=\"%H|%an|%ar|%s\"'",
+                self._ssh_base + [
+                    "pgrep -f gunicorn; echo ---; "
+                    'cd /opt/nomadic-influence/backend && git log -1 --format="%H|%an|%ar|%s"'
+                ],
                 timeout=30
             )
-            
-            if git_result["stdout"]:
-                commit_hash, author, time_ago, message = git_result["stdout"].strip().split("|", 3)
-                
+
+            pgrep_output, _, git_output = result["stdout"].partition("---")
+            is_running = bool(pgrep_output.strip())
+            git_line = git_output.strip()
+
+            if git_line:
+                commit_hash, author, time_ago, message = git_line.split("|", 3)
+
                 return {
                     "is_running": is_running,
                     "last_commit": {
@@ -2,7 +2,8 @@
 Deployment tracking model.
 """
 import sqlite3
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 import logging
@@ -10,9 +11,52 @@ import logging
 logger = logging.getLogger("jinkies.deployment_store")
 
 
+# Column order shared by the SELECTs and Deployment.from_row
+_DEP_COLS = (
+    "id, branch, commit_hash, triggered_by, started_at_ms, completed_at_ms, "
+    "status, method, duration_seconds, output_logs, error_message, "
+    "discord_channel_id, frontend_deployed, backend_deployed, "
+    "cloudfront_invalidation_id"
+)
+
+# Parsed once by SQLite's statement cache; a NULL id inserts a new row
+# (AUTOINCREMENT assigns), a known id updates it in place
+_UPSERT_SQL = f"""
+    INSERT INTO deployments ({_DEP_COLS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        branch = excluded.branch,
+        commit_hash = excluded.commit_hash,
+        triggered_by = excluded.triggered_by,
+        started_at_ms = excluded.started_at_ms,
+        completed_at_ms = excluded.completed_at_ms,
+        status = excluded.status,
+        method = excluded.method,
+        duration_seconds = excluded.duration_seconds,
+        output_logs = excluded.output_logs,
+        error_message = excluded.error_message,
+        discord_channel_id = excluded.discord_channel_id,
+        frontend_deployed = excluded.frontend_deployed,
+        backend_deployed = excluded.backend_deployed,
+        cloudfront_invalidation_id = excluded.cloudfront_invalidation_id
+"""
+
+
 class Deployment:
-    """Represents a deployment record."""
-    
+    """Represents a deployment record.
+
+    Timestamps are stored in SQLite as INTEGER Unix epoch milliseconds
+    and kept in that form until first attribute access - list queries
+    that just re-serialize via to_dict skip building datetime objects.
+    """
+
+    __slots__ = (
+        "id", "branch", "commit_hash", "triggered_by", "_started_at",
+        "_completed_at", "status", "method", "duration_seconds",
+        "output_logs", "error_message", "discord_channel_id",
+        "frontend_deployed", "backend_deployed", "cloudfront_invalidation_id",
+    )
+
     def __init__(
         self,
         id: Optional[int] = None,
@@ -35,8 +79,8 @@ class Deployment:
         self.branch = branch
         self.commit_hash = commit_hash
         self.triggered_by = triggered_by
-        self.started_at = started_at or datetime.utcnow()
-        self.completed_at = completed_at
+        self._started_at = started_at or datetime.utcnow()
+        self._completed_at = completed_at
         self.status = status
         self.method = method
         self.duration_seconds = duration_seconds
@@ -46,7 +90,59 @@ class Deployment:
         self.frontend_deployed = frontend_deployed
         self.backend_deployed = backend_deployed
         self.cloudfront_invalidation_id = cloudfront_invalidation_id
-    
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Deployment":
+        """Build a Deployment from a row ordered as _DEP_COLS."""
+        deployment = cls.__new__(cls)
+        (deployment.id, deployment.branch, deployment.commit_hash,
+         deployment.triggered_by, deployment._started_at,
+         deployment._completed_at, deployment.status, deployment.method,
+         deployment.duration_seconds, deployment.output_logs,
+         deployment.error_message, deployment.discord_channel_id,
+         frontend, backend, deployment.cloudfront_invalidation_id) = row
+        deployment.frontend_deployed = frontend != 0
+        deployment.backend_deployed = backend != 0
+        return deployment
+
+    @property
+    def started_at(self) -> Optional[datetime]:
+        if isinstance(self._started_at, int):
+            self._started_at = datetime.utcfromtimestamp(self._started_at / 1000)
+        return self._started_at
+
+    @started_at.setter
+    def started_at(self, value):
+        self._started_at = value
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        if isinstance(self._completed_at, int):
+            self._completed_at = datetime.utcfromtimestamp(self._completed_at / 1000)
+        return self._completed_at
+
+    @completed_at.setter
+    def completed_at(self, value):
+        self._completed_at = value
+
+    @staticmethod
+    def _epoch_ms(value) -> Optional[int]:
+        """Serialize a timestamp that may be a datetime, epoch ms or None."""
+        if value is None or isinstance(value, int):
+            return value
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+
+    @staticmethod
+    def _iso(value) -> Optional[str]:
+        """ISO-8601 render of a timestamp that may be a datetime, epoch ms or None."""
+        if isinstance(value, int):
+            return datetime.utcfromtimestamp(value / 1000).isoformat()
+        if value is None:
+            return None
+        return value.isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -54,8 +150,8 @@ class Deployment:
             "branch": self.branch,
             "commit_hash": self.commit_hash,
             "triggered_by": self.triggered_by,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "started_at": self._iso(self._started_at),
+            "completed_at": self._iso(self._completed_at),
             "status": self.status,
             "method": self.method,
             "duration_seconds": self.duration_seconds,
@@ -74,19 +170,30 @@ class DeploymentStore:
     def __init__(self, db_path: str = "deployments.db"):
         """Initialize deployment store."""
         self.db_path = Path(db_path)
+
+        # One connection for the process lifetime: per-call connect() pays
+        # schema reparse and journal fsync every operation. WAL lets readers
+        # proceed while a write commits. The lock serializes access since
+        # check_same_thread is off.
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
         self._init_database()
-    
+
     def _init_database(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        with self._lock:
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS deployments (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     branch TEXT NOT NULL,
                     commit_hash TEXT,
                     triggered_by TEXT NOT NULL,
-                    started_at TEXT NOT NULL,
-                    completed_at TEXT,
+                    started_at_ms INTEGER NOT NULL,
+                    completed_at_ms INTEGER,
                     status TEXT NOT NULL,
                     method TEXT NOT NULL,
                     duration_seconds INTEGER,
@@ -98,141 +205,148 @@ class DeploymentStore:
                     cloudfront_invalidation_id TEXT
                 )
             """)
-            conn.commit()
+
+            self._migrate_timestamps_to_ms()
+
+            # List queries filter on status and order by started_at_ms /
+            # completed_at_ms DESC; composite indexes avoid full scan + sort
+            self._conn.execute("DROP INDEX IF EXISTS idx_dep_started")
+            self._conn.execute("DROP INDEX IF EXISTS idx_dep_status_started")
+            self._conn.execute("DROP INDEX IF EXISTS idx_dep_status_completed")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_dep_started_ms ON deployments(started_at_ms DESC)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_dep_status_started_ms ON deployments(status, started_at_ms DESC)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_dep_status_completed_ms ON deployments(status, completed_at_ms DESC)"
+            )
+
             logger.info(f"Deployment database initialized at {self.db_path}")
-    
-    def save_deployment(self, deployment: Deployment) -> int:
-        """Save a deployment record."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO deployments (
-                    branch, commit_hash, triggered_by, started_at, completed_at,
-                    status, method, duration_seconds, output_logs, error_message,
-                    discord_channel_id, frontend_deployed, backend_deployed,
-                    cloudfront_invalidation_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                deployment.branch,
-                deployment.commit_hash,
-                deployment.triggered_by,
-                deployment.started_at.isoformat() if deployment.started_at else None,
-                deployment.completed_at.isoformat() if deployment.completed_at else None,
-                deployment.status,
-                deployment.method,
-                deployment.duration_seconds,
-                deployment.output_logs,
-                deployment.error_message,
-                deployment.discord_channel_id,
-                1 if deployment.frontend_deployed else 0,
-                1 if deployment.backend_deployed else 0,
-                deployment.cloudfront_invalidation_id,
-            ))
-            conn.commit()
-            deployment.id = cursor.lastrowid
-            logger.info(f"Saved deployment {deployment.id}")
+
+    def _migrate_timestamps_to_ms(self):
+        """Migrate legacy TEXT ISO timestamp columns to INTEGER Unix-ms.
+
+        Integer epoch milliseconds compare natively in the B-tree index
+        (no 19-byte string comparisons) and skip isoformat/fromisoformat
+        on every write/read, at roughly half the stored width.
+        """
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(deployments)")}
+        if "started_at" not in columns:
+            return
+
+        self._conn.execute("BEGIN")
+        if "started_at_ms" not in columns:
+            self._conn.execute("ALTER TABLE deployments ADD COLUMN started_at_ms INTEGER")
+            self._conn.execute("ALTER TABLE deployments ADD COLUMN completed_at_ms INTEGER")
+        self._conn.execute(
+            "UPDATE deployments SET "
+            "started_at_ms = CAST(strftime('%s', started_at) AS INTEGER) * 1000, "
+            "completed_at_ms = CAST(strftime('%s', completed_at) AS INTEGER) * 1000"
+        )
+        self._conn.execute("ALTER TABLE deployments DROP COLUMN started_at")
+        self._conn.execute("ALTER TABLE deployments DROP COLUMN completed_at")
+        self._conn.execute("COMMIT")
+        logger.info("Migrated deployment timestamps to INTEGER Unix-ms")
+
+    def upsert_deployment(self, deployment: Deployment) -> int:
+        """Insert or update a deployment record in one statement.
+
+        A deploy writes its record at start (no id yet) and again at
+        completion; a single INSERT ... ON CONFLICT(id) DO UPDATE covers
+        both with one commit per state change instead of an INSERT
+        followed by a full-row UPDATE, and makes the in_progress ->
+        success/failed transition atomic.
+        """
+        with self._lock:
+            cursor = self._conn.execute(_UPSERT_SQL, self._to_row(deployment))
+            if deployment.id is None:
+                deployment.id = cursor.lastrowid
+            logger.info(f"Upserted deployment {deployment.id}")
             return deployment.id
-    
-    def update_deployment(self, deployment: Deployment):
-        """Update an existing deployment record."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                UPDATE deployments SET
-                    branch = ?,
-                    commit_hash = ?,
-                    triggered_by = ?,
-                    started_at = ?,
-                    completed_at = ?,
-                    status = ?,
-                    method = ?,
-                    duration_seconds = ?,
-                    output_logs = ?,
-                    error_message = ?,
-                    discord_channel_id = ?,
-                    frontend_deployed = ?,
-                    backend_deployed = ?,
-                    cloudfront_invalidation_id = ?
-                WHERE id = ?
-            """, (
-                deployment.branch,
-                deployment.commit_hash,
-                deployment.triggered_by,
-                deployment.started_at.isoformat() if deployment.started_at else None,
-                deployment.completed_at.isoformat() if deployment.completed_at else None,
-                deployment.status,
-                deployment.method,
-                deployment.duration_seconds,
-                deployment.output_logs,
-                deployment.error_message,
-                deployment.discord_channel_id,
-                1 if deployment.frontend_deployed else 0,
-                1 if deployment.backend_deployed else 0,
-                deployment.cloudfront_invalidation_id,
-                deployment.id,
-            ))
-            conn.commit()
-            logger.info(f"Updated deployment {deployment.id}")
-    
+
+    def save_deployments_bulk(self, deployments: List[Deployment]) -> int:
+        """Upsert many deployment records in one transaction.
+
+        executemany reuses the prepared statement across rows and the
+        explicit BEGIN/COMMIT amortizes the fsync over the whole batch
+        instead of paying it per row - this is the path for backfilling
+        history or importing records from GitHub Actions.
+        """
+        if not deployments:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    _UPSERT_SQL, (self._to_row(d) for d in deployments)
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            logger.info(f"Bulk-saved {len(deployments)} deployments")
+            return len(deployments)
+
+    @staticmethod
+    def _to_row(deployment: Deployment) -> tuple:
+        """Parameter tuple for _UPSERT_SQL, ordered as _DEP_COLS."""
+        return (
+            deployment.id,
+            deployment.branch,
+            deployment.commit_hash,
+            deployment.triggered_by,
+            Deployment._epoch_ms(deployment._started_at),
+            Deployment._epoch_ms(deployment._completed_at),
+            deployment.status,
+            deployment.method,
+            deployment.duration_seconds,
+            deployment.output_logs,
+            deployment.error_message,
+            deployment.discord_channel_id,
+            1 if deployment.frontend_deployed else 0,
+            1 if deployment.backend_deployed else 0,
+            deployment.cloudfront_invalidation_id,
+        )
+
     def get_deployment(self, deployment_id: int) -> Optional[Deployment]:
         """Get a deployment by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM deployments WHERE id = ?",
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {_DEP_COLS} FROM deployments WHERE id = ?",
                 (deployment_id,)
             )
             row = cursor.fetchone()
             if row:
-                return self._row_to_deployment(row)
+                return Deployment.from_row(row)
             return None
-    
+
     def get_recent_deployments(self, limit: int = 10) -> List[Deployment]:
         """Get recent deployments."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM deployments ORDER BY started_at DESC LIMIT ?",
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {_DEP_COLS} FROM deployments ORDER BY started_at_ms DESC LIMIT ?",
                 (limit,)
             )
-            return [self._row_to_deployment(row) for row in cursor.fetchall()]
-    
+            return [Deployment.from_row(row) for row in cursor.fetchall()]
+
     def get_deployments_by_status(self, status: str) -> List[Deployment]:
         """Get deployments by status."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM deployments WHERE status = ? ORDER BY started_at DESC",
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {_DEP_COLS} FROM deployments WHERE status = ? ORDER BY started_at_ms DESC",
                 (status,)
             )
-            return [self._row_to_deployment(row) for row in cursor.fetchall()]
-    
+            return [Deployment.from_row(row) for row in cursor.fetchall()]
+
     def get_last_successful_deployment(self) -> Optional[Deployment]:
         """Get the last successful deployment."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM deployments WHERE status = 'success' ORDER BY completed_at DESC LIMIT 1"
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {_DEP_COLS} FROM deployments WHERE status = 'success' ORDER BY completed_at_ms DESC LIMIT 1"
             )
             row = cursor.fetchone()
             if row:
-                return self._row_to_deployment(row)
+                return Deployment.from_row(row)
             return None
-    
-    def _row_to_deployment(self, row: sqlite3.Row) -> Deployment:
-        """Convert database row to Deployment object."""
-        return Deployment(
-            id=row["id"],
-            branch=row["branch"],
-            commit_hash=row["commit_hash"],
-            triggered_by=row["triggered_by"],
-            started_at=datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
-            completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
-            status=row["status"],
-            method=row["method"],
-            duration_seconds=row["duration_seconds"],
-            output_logs=row["output_logs"],
-            error_message=row["error_message"],
-            discord_channel_id=row["discord_channel_id"],
-            frontend_deployed=bool(row["frontend_deployed"]),
-            backend_deployed=bool(row["backend_deployed"]),
-            cloudfront_invalidation_id=row["cloudfront_invalidation_id"],
-        )
@@ -1,33 +1,697 @@
 """
 GitHub integration for PR and issue creation.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import aiohttp
 from github import Github, GithubException
+from urllib3.util.retry import Retry
 from bot.config import config
 from bot.models.alert import Alert
 from bot.services.ai_service import AIService
+import asyncio
+import base64
+import functools
+import hashlib
 import logging
 import json
+import time
 
 logger = logging.getLogger("jinkies.github")
 
+GITHUB_API = "https://api.github.com"
+
+# One pooled session shared by every AsyncGitHubService instance, so
+# back-to-back alert handlers reuse TCP+TLS connections instead of
+# re-handshaking per request. Created lazily inside the running loop.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+_session_lock = asyncio.Lock()
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Get (or lazily create) the shared GitHub API session."""
+    global _session
+    if _session is None or _session.closed:
+        async with _session_lock:
+            if _session is None or _session.closed:
+                _session = aiohttp.ClientSession(
+                    headers={
+                        "Authorization": f"Bearer {config.GITHUB_PRIVATE_KEY}",
+                        "Accept": "application/vnd.github+json",
+                    },
+                    connector=aiohttp.TCPConnector(
+                        limit=64,
+                        limit_per_host=16,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=75,
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=30),
+                )
+    return _session
+
+
+async def close_session():
+    """Close the shared session (called on bot shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+# GraphQL documents used by AsyncGitHubService. Repository and label ids
+# are immutable, so they are resolved once and cached on the class.
+_REPO_IDS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) { nodes { id name } }
+  }
+}
+"""
+
+_BASE_OID_QUERY = """
+query($owner: String!, $name: String!, $ref: String!) {
+  repository(owner: $owner, name: $name) { ref(qualifiedName: $ref) { target { oid } } }
+}
+"""
+
+_CREATE_REF_MUTATION = """
+mutation($input: CreateRefInput!) { createRef(input: $input) { ref { name } } }
+"""
+
+_CREATE_PR_MUTATION = """
+mutation($input: CreatePullRequestInput!) {
+  createPullRequest(input: $input) { pullRequest { id number url } }
+}
+"""
+
+_ADD_LABELS_MUTATION = """
+mutation($labelableId: ID!, $labelIds: [ID!]!) {
+  addLabelsToLabelable(input: {labelableId: $labelableId, labelIds: $labelIds}) {
+    clientMutationId
+  }
+}
+"""
+
+_CREATE_ISSUE_MUTATION = """
+mutation($input: CreateIssueInput!) {
+  createIssue(input: $input) { issue { url } }
+}
+"""
+
+
+class GitHubApiError(Exception):
+    """Raised when the GitHub REST API returns an unexpected status."""
+
+    def __init__(self, status: int, message: str):
+        self.status = status
+        super().__init__(f"GitHub API returned {status}: {message[:200]}")
+
+
+class _TokenBucket:
+    """Async pacing limiter: at most max_rate acquisitions per time_period.
+
+    GitHub's secondary rate limit caps content creation (PRs, issues,
+    comments, commits) at roughly 20-30 per minute; during an alert
+    storm concurrent handlers queue here instead of collecting 403s.
+    """
+
+    def __init__(self, max_rate: int, time_period: float):
+        self._interval = time_period / max_rate
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def __aenter__(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# Shared by all instances so concurrent webhook handlers are throttled
+# together, not per-service-object
+_write_limiter = _TokenBucket(max_rate=20, time_period=60.0)
+
+# Longest we will sleep waiting out a rate-limit window before giving up
+_MAX_RATE_LIMIT_DELAY = 120.0
+
+
+def _rate_limit_delay(headers) -> Optional[float]:
+    """Seconds to wait per the response's rate-limit headers, if any."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), _MAX_RATE_LIMIT_DELAY)
+        except ValueError:
+            return None
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = headers.get("X-RateLimit-Reset")
+        if reset:
+            try:
+                return min(max(float(reset) - time.time(), 1.0), _MAX_RATE_LIMIT_DELAY)
+            except ValueError:
+                return None
+    return None
+
+
+# Recently created PRs keyed by alert content fingerprint, shared by the
+# sync and async services. A retry loop in the monitored app fires the
+# same alert repeatedly, and without this each occurrence creates a
+# fresh branch + PR - burning GitHub's secondary content-creation limit
+# on duplicates. Values are (monotonic time, pr_url).
+_recent_prs: Dict[str, tuple] = {}
+_RECENT_PR_TTL = 3600.0
+_RECENT_PR_MAX = 1024
+
+
+def _alert_fingerprint(alert: Alert) -> str:
+    """Content hash identifying an alert for PR deduplication."""
+    key = f"{alert.exception_type}|{alert.service_name}|{alert.stack_trace}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _recent_pr_url(key: str) -> Optional[str]:
+    """URL of a PR created for this fingerprint within the TTL, if any."""
+    cached = _recent_prs.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= _RECENT_PR_TTL:
+        del _recent_prs[key]
+        return None
+    return cached[1]
+
+
+def _remember_pr(key: str, url: str):
+    """Record a created PR, pruning expired/oldest entries past the cap."""
+    now = time.monotonic()
+    if len(_recent_prs) >= _RECENT_PR_MAX:
+        for stale in [k for k, v in _recent_prs.items() if now - v[0] >= _RECENT_PR_TTL]:
+            del _recent_prs[stale]
+        while len(_recent_prs) >= _RECENT_PR_MAX:
+            del _recent_prs[min(_recent_prs, key=lambda k: _recent_prs[k][0])]
+    _recent_prs[key] = (now, url)
+
+
+def _alert_labels(alert: Alert) -> List[str]:
+    """Labels applied to PRs/issues created from an alert."""
+    labels = ["bug", "automated"]
+    if alert.severity == "CRITICAL":
+        labels.append("critical")
+    return labels
+
+
+def _generate_pr_title(alert: Alert) -> str:
+    """Generate PR title from alert."""
+    return f"Fix: {alert.exception_type} in {alert.service_name}"
+
+
+# Fully static template sections, built once at import. The dynamic
+# sections stay f-strings; only the text that never changes between
+# alerts is hoisted here so each body render formats the minimum.
+_PR_BEHAVIOR_SECTION = """### Expected Behavior
+The application should handle this case gracefully without throwing an exception.
+
+### Actual Behavior
+The application encountered an unhandled exception.
+
+"""
+
+_PR_FOOTER = """---
+*This PR was automatically generated by the Jinkies monitoring bot.*
+"""
+
+_ISSUE_FOOTER = """---
+*This issue was automatically created by the Jinkies monitoring bot.*
+"""
+
+
+def _generate_pr_body(alert: Alert, fix_notes: Optional[str] = None) -> str:
+    """Generate PR body from alert.
+
+    Built as a list of rendered sections joined once at the end;
+    f-strings compile to bytecode, so each section renders in a single
+    pass with no incremental concatenation copies.
+    """
+    parts = [f"""## 🚨 Auto-generated PR from Alert {alert.get_short_id()}
+
+### What Happened
+An error was detected in **{alert.environment}** environment.
+
+### Error Summary
+- **Service**: {alert.service_name}
+- **Exception**: {alert.exception_type}
+- **Message**: {alert.error_message}
+- **Endpoint**: {alert.request_path or 'N/A'}
+- **Timestamp**: {alert.timestamp}
+- **Django Alert**: [{alert.django_alert_id[:8]}]({alert.get_django_url()})
+
+### Stack Trace
+```
+{alert.get_trimmed_stack_trace()}
+```
+
+### Additional Context
+```json
+{json.dumps(alert.additional_context, indent=2) if alert.additional_context else 'None'}
+```
+
+""", _PR_BEHAVIOR_SECTION]
+
+    if fix_notes:
+        parts.append(f"""### Proposed Fix
+{fix_notes}
+
+""")
+
+    parts.append(f"""### Alert Reference
+- **Alert ID**: `{alert.alert_id}`
+- **Django ID**: `{alert.django_alert_id}`
+- **Environment**: `{alert.environment}`
+- **View in Django**: {alert.get_django_url()}
+
+""")
+    parts.append(_PR_FOOTER)
+
+    return "".join(parts)
+
+
+def _generate_issue_title(alert: Alert) -> str:
+    """Generate issue title from alert."""
+    return f"[{alert.severity}] {alert.exception_type}: {alert.error_message[:50]}"
+
+
+def _generate_issue_body(alert: Alert) -> str:
+    """Generate issue body from alert."""
+    return f"""## Error Report (Alert {alert.get_short_id()})
+
+### Environment
+- **Service**: {alert.service_name}
+- **Environment**: {alert.environment}
+- **Timestamp**: {alert.timestamp}
+- **Severity**: {alert.severity}
+
+### Error Details
+**Exception Type**: {alert.exception_type}
+
+**Error Message**:
+```
+{alert.error_message}
+```
+
+**Request Path**: {alert.request_path or 'N/A'}
+
+**Django Alert**: [{alert.django_alert_id[:8]}]({alert.get_django_url()})
+
+### Stack Trace
+```
+{alert.get_trimmed_stack_trace()}
+```
+
+### Additional Context
+```json
+{json.dumps(alert.additional_context, indent=2) if alert.additional_context else 'None'}
+```
+
+### Alert Reference
+- **Jinkies ID**: `{alert.alert_id}`
+- **Django ID**: `{alert.django_alert_id}`
+- **View in Django**: {alert.get_django_url()}
+
+""" + _ISSUE_FOOTER
+
+
+def _fix_branch_readme(alert: Alert) -> str:
+    """Initial commit content for an alert fix branch."""
+    return f"""# Fix for Alert {alert.get_short_id()}
+
+## Error Details
+- **Service**: {alert.service_name}
+- **Exception**: {alert.exception_type}
+- **Message**: {alert.error_message}
+
+## TODO
+- [ ] Identify root cause
+- [ ] Implement fix
+- [ ] Add tests
+- [ ] Update documentation
+
+See PR description for full details.
+"""
+
+
+class AsyncGitHubService:
+    """Non-blocking GitHub API service for the alert flow.
+
+    PyGithub is synchronous, so PR creation (get ref, create ref, create
+    files, create PR, add labels) used to block the event loop for
+    several network round-trips while the webhook server and Discord
+    heartbeat waited. This talks to the REST API directly through the
+    shared aiohttp session so handlers can await each step.
+    """
+
+    # repositoryId + label name->id map, shared across instances (the
+    # webhook handlers construct a fresh service per reaction)
+    _repo_ids: Optional[Dict[str, Any]] = None
+
+    # Base branch tip oid, cached briefly: alert fix branches only add
+    # new scaffold files, so branching from a tip up to this many
+    # seconds old is harmless and saves a query per PR
+    _base_oid_cache: Dict[str, tuple] = {}
+    BASE_OID_TTL = 600.0
 
-class GitHubService:
-    """Service for GitHub API interactions."""
-    
     def __init__(self):
+        self.owner = config.GITHUB_REPO_OWNER
+        self.repo_name = config.GITHUB_REPO_NAME
+        self.ai_service = AIService()
+
+    async def _api_call(
+        self,
+        method: str,
+        url: str,
+        json_body: Optional[Dict[str, Any]],
+        is_write: bool,
+    ) -> aiohttp.ClientResponse:
+        """One paced, rate-limit-aware request. Caller releases the response."""
+        session = await _get_session()
+        for attempt in range(3):
+            if is_write:
+                async with _write_limiter:
+                    response = await session.request(method, url, json=json_body)
+            else:
+                response = await session.request(method, url, json=json_body)
+
+            if response.status in (403, 429) and attempt < 2:
+                delay = _rate_limit_delay(response.headers)
+                if delay is not None:
+                    response.release()
+                    logger.warning(f"GitHub rate limited; retrying in {delay:.0f}s")
+                    await asyncio.sleep(delay)
+                    continue
+            return response
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Issue one API request; raise GitHubApiError on a 4xx/5xx."""
+        response = await self._api_call(
+            method, f"{GITHUB_API}{path}", json_body, is_write=method != "GET"
+        )
+        try:
+            if response.status >= 400:
+                raise GitHubApiError(response.status, await response.text())
+            if response.status == 204:
+                return None
+            return await response.json()
+        finally:
+            response.release()
+
+    def _repo_path(self, suffix: str) -> str:
+        return f"/repos/{self.owner}/{self.repo_name}{suffix}"
+
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one GraphQL query/mutation and return its data payload."""
+        response = await self._api_call(
+            "POST",
+            f"{GITHUB_API}/graphql",
+            {"query": query, "variables": variables},
+            is_write=query.lstrip().startswith("mutation"),
+        )
+        try:
+            if response.status >= 400:
+                raise GitHubApiError(response.status, await response.text())
+            payload = await response.json()
+            if payload.get("errors"):
+                raise GitHubApiError(response.status, str(payload["errors"]))
+            return payload["data"]
+        finally:
+            response.release()
+
+    async def _get_repo_ids(self) -> Dict[str, Any]:
+        """Resolve (and cache) the repository node id and label ids."""
+        cls = type(self)
+        if cls._repo_ids is None:
+            data = await self._graphql(
+                _REPO_IDS_QUERY, {"owner": self.owner, "name": self.repo_name}
+            )
+            repository = data["repository"]
+            cls._repo_ids = {
+                "id": repository["id"],
+                "labels": {node["name"]: node["id"] for node in repository["labels"]["nodes"]},
+            }
+        return cls._repo_ids
+
+    async def _base_oid(self, base: str) -> str:
+        """Tip commit oid of the base branch, cached for BASE_OID_TTL."""
+        cached = self._base_oid_cache.get(base)
+        if cached and time.monotonic() - cached[0] < self.BASE_OID_TTL:
+            return cached[1]
+
+        data = await self._graphql(
+            _BASE_OID_QUERY,
+            {"owner": self.owner, "name": self.repo_name, "ref": f"refs/heads/{base}"},
+        )
+        oid = data["repository"]["ref"]["target"]["oid"]
+        self._base_oid_cache[base] = (time.monotonic(), oid)
+        return oid
+
+    async def _label_ids(self, names: List[str]) -> List[str]:
+        """Node ids for the given label names, skipping ones that don't exist."""
+        labels = (await self._get_repo_ids())["labels"]
+        return [labels[name] for name in names if name in labels]
+
+    async def _create_file(self, path: str, message: str, content: str, branch: str):
+        """Create a file on a branch via the contents API."""
+        await self._request(
+            "PUT",
+            self._repo_path(f"/contents/{path}"),
+            json_body={
+                "message": message,
+                "content": base64.b64encode(content.encode()).decode(),
+                "branch": branch,
+            },
+        )
+
+    async def create_pr_from_alert(
+        self,
+        alert: Alert,
+        base_branch: Optional[str] = None,
+        fix_notes: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Create a GitHub PR from an alert.
+
+        Args:
+            alert: Alert object with error details
+            base_branch: Target branch (default from config)
+            fix_notes: Optional additional notes from user
+
+        Returns:
+            PR URL if successful, None otherwise
         """
-        Initialize GitHub client.
-        
-        Note: In production, use GitHub App authentication instead of personal
-        access tokens for better security, higher rate limits, and granular permissions.
-        See: https://docs.github.com/en/apps/creating-github-apps
+        try:
+            # Identical alerts within the TTL reuse the PR we already opened
+            fingerprint = _alert_fingerprint(alert)
+            cached_url = _recent_pr_url(fingerprint)
+            if cached_url:
+                logger.info(f"Reusing recent PR for duplicate alert {alert.get_short_id()}")
+                return cached_url
+
+            base = base_branch or config.DEFAULT_BASE_BRANCH
+            branch_name = f"fix/alert-{alert.get_short_id()}"
+
+            title = _generate_pr_title(alert)
+            body = _generate_pr_body(alert, fix_notes)
+
+            repo_ids = await self._get_repo_ids()
+            base_oid = await self._base_oid(base)
+
+            # Delete a stale branch from an earlier attempt, if any
+            try:
+                await self._request("DELETE", self._repo_path(f"/git/refs/heads/{branch_name}"))
+                logger.info(f"Deleted existing branch {branch_name}")
+            except GitHubApiError:
+                pass  # Branch doesn't exist, that's fine
+
+            await self._graphql(
+                _CREATE_REF_MUTATION,
+                {"input": {
+                    "repositoryId": repo_ids["id"],
+                    "name": f"refs/heads/{branch_name}",
+                    "oid": base_oid,
+                }},
+            )
+
+            # Generate AI fix prompt if available; the OpenAI client is
+            # synchronous, so keep it off the event loop
+            fix_prompt = await asyncio.to_thread(self.ai_service.generate_fix_prompt, alert)
+            if fix_prompt:
+                copilot_instructions = f"""# GitHub Copilot Fix Instructions
+
+{fix_prompt}
+
+---
+*This fix prompt was automatically generated by Jinkies AI from alert {alert.alert_id}*
+"""
+                await self._create_file(
+                    path=f"COPILOT_FIX_{alert.get_short_id()}.md",
+                    message=f"Add Copilot fix instructions for alert {alert.get_short_id()}",
+                    content=copilot_instructions,
+                    branch=branch_name,
+                )
+                logger.info(f"Created Copilot instructions for alert {alert.get_short_id()}")
+
+            await self._create_file(
+                path=f"ALERT_{alert.get_short_id()}.md",
+                message=f"Initialize fix branch for alert {alert.get_short_id()}",
+                content=_fix_branch_readme(alert),
+                branch=branch_name,
+            )
+            logger.info(f"Created branch {branch_name} with initial commit")
+
+            pr_data = await self._graphql(
+                _CREATE_PR_MUTATION,
+                {"input": {
+                    "repositoryId": repo_ids["id"],
+                    "baseRefName": base,
+                    "headRefName": branch_name,
+                    "title": title,
+                    "body": body,
+                    "draft": True,
+                }},
+            )
+            pr = pr_data["createPullRequest"]["pullRequest"]
+
+            # createPullRequest has no labelIds input; attach labels with a
+            # follow-up mutation using the pre-resolved ids (missing labels
+            # are simply skipped instead of failing the request)
+            label_ids = await self._label_ids(_alert_labels(alert))
+            if label_ids:
+                try:
+                    await self._graphql(
+                        _ADD_LABELS_MUTATION,
+                        {"labelableId": pr["id"], "labelIds": label_ids},
+                    )
+                except GitHubApiError as e:
+                    logger.warning(f"Could not label PR #{pr['number']}: {e}")
+
+            _remember_pr(fingerprint, pr["url"])
+            return pr["url"]
+
+        except Exception as e:
+            logger.error(f"Error creating PR: {e}", exc_info=True)
+            return None
+
+    async def create_issue_from_alert(self, alert: Alert) -> Optional[str]:
         """
-        # Use personal access token (stored in GITHUB_PRIVATE_KEY for simplicity)
-        self.client = Github(config.GITHUB_PRIVATE_KEY)
-        self.repo = self.client.get_repo(f"{config.GITHUB_REPO_OWNER}/{config.GITHUB_REPO_NAME}")
+        Create a GitHub issue from an alert.
+
+        Args:
+            alert: Alert object with error details
+
+        Returns:
+            Issue URL if successful, None otherwise
+        """
+        try:
+            # createIssue accepts labelIds inline, so creation and
+            # labelling is one atomic round-trip
+            repo_ids = await self._get_repo_ids()
+            issue_data = await self._graphql(
+                _CREATE_ISSUE_MUTATION,
+                {"input": {
+                    "repositoryId": repo_ids["id"],
+                    "title": _generate_issue_title(alert),
+                    "body": _generate_issue_body(alert),
+                    "labelIds": await self._label_ids(_alert_labels(alert)),
+                }},
+            )
+            return issue_data["createIssue"]["issue"]["url"]
+
+        except Exception as e:
+            logger.error(f"Error creating issue: {e}", exc_info=True)
+            return None
+
+    async def create_pr_comment(self, pr_number: int, body: str):
+        """Comment on a PR (PRs share the issues comment endpoint)."""
+        await self._request(
+            "POST",
+            self._repo_path(f"/issues/{pr_number}/comments"),
+            json_body={"body": body},
+        )
+
+    async def test_connection(self) -> bool:
+        """Test GitHub API connection."""
+        try:
+            await self._request("GET", self._repo_path(""))
+            return True
+        except Exception as e:
+            logger.error(f"GitHub connection test failed: {e}", exc_info=True)
+            return False
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_repo():
+    """Cached (client, repository) pair for the sync service.
+
+    get_repo performs a network round-trip, so constructing a fresh
+    GitHubService per command/reaction used to re-fetch the same
+    immutable repository metadata every time.
+
+    Note: In production, use GitHub App authentication instead of personal
+    access tokens for better security, higher rate limits, and granular
+    permissions. See: https://docs.github.com/en/apps/creating-github-apps
+    """
+    # Use personal access token (stored in GITHUB_PRIVATE_KEY for simplicity).
+    # pool_size keeps TCP+TLS connections alive between calls so the
+    # multi-request PR flow doesn't re-handshake per call, per_page=100
+    # cuts pagination round-trips (e.g. get_branches), and the Retry
+    # policy absorbs transient gateway errors.
+    client = Github(
+        config.GITHUB_PRIVATE_KEY,
+        pool_size=20,
+        per_page=100,
+        retry=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+    )
+    repo = client.get_repo(f"{config.GITHUB_REPO_OWNER}/{config.GITHUB_REPO_NAME}")
+    return client, repo
+
+
+@functools.lru_cache(maxsize=1)
+def _repo_label_names() -> frozenset:
+    """Label names that exist on the repository, fetched once.
+
+    Labelling used to be a blind add_to_labels wrapped in a bare except,
+    paying a failing round-trip per alert whenever a label was missing;
+    filtering against this set skips the call client-side instead.
+    """
+    _, repo = _shared_repo()
+    return frozenset(label.name for label in repo.get_labels())
+
+
+class GitHubService:
+    """Synchronous PyGithub-backed service.
+
+    Kept for callers that drive the richer PyGithub object model from
+    executor threads; the alert flow uses AsyncGitHubService.
+    """
+
+    # Last successful test_connection (monotonic time); see below
+    _connection_ok_at: Optional[float] = None
+
+    def __init__(self):
+        """Initialize GitHub client (shared handle, see _shared_repo)."""
+        self.client, self.repo = _shared_repo()
         self.ai_service = AIService()
-    
+
     def create_pr_from_alert(
         self,
         alert: Alert,
@@ -36,27 +700,34 @@ class GitHubService:
     ) -> Optional[str]:
         """
         Create a GitHub PR from an alert.
-        
+
         Args:
             alert: Alert object with error details
             base_branch: Target branch (default from config)
             fix_notes: Optional additional notes from user
-        
+
         Returns:
             PR URL if successful, None otherwise
         """
         try:
+            # Identical alerts within the TTL reuse the PR we already opened
+            fingerprint = _alert_fingerprint(alert)
+            cached_url = _recent_pr_url(fingerprint)
+            if cached_url:
+                logger.info(f"Reusing recent PR for duplicate alert {alert.get_short_id()}")
+                return cached_url
+
             base = base_branch or config.DEFAULT_BASE_BRANCH
             branch_name = f"fix/alert-{alert.get_short_id()}"
-            
+
             # Generate PR content
-            title = self._generate_pr_title(alert)
-            body = self._generate_pr_body(alert, fix_notes)
-            
+            title = _generate_pr_title(alert)
+            body = _generate_pr_body(alert, fix_notes)
+
             # Create branch (from base branch)
             try:
                 base_ref = self.repo.get_git_ref(f"heads/{base}")
-                
+
                 # Check if branch already exists and delete it
                 try:
                     existing_ref = self.repo.get_git_ref(f"heads/{branch_name}")
@@ -64,30 +735,13 @@ class GitHubService:
                     logger.info(f"Deleted existing branch {branch_name}")
                 except GithubException:
                     pass  # Branch doesn't exist, that's fine
-                
+
                 # Create new branch
                 self.repo.create_git_ref(
                     ref=f"refs/heads/{branch_name}",
                     sha=base_ref.object.sha
                 )
-                
-                # Create an initial commit on the branch with PR details
-                readme_content = f"""# Fix for Alert {alert.get_short_id()}
 
-## Error Details
-- **Service**: {alert.service_name}
-- **Exception**: {alert.exception_type}
-- **Message**: {alert.error_message}
-
-## TODO
-- [ ] Identify root cause
-- [ ] Implement fix
-- [ ] Add tests
-- [ ] Update documentation
-
-See PR description for full details.
-"""
-                
                 # Generate AI fix prompt if available
                 fix_prompt = self.ai_service.generate_fix_prompt(alert)
                 if fix_prompt:
@@ -106,20 +760,20 @@ See PR description for full details.
                         branch=branch_name
                     )
                     logger.info(f"Created Copilot instructions for alert {alert.get_short_id()}")
-                
+
                 # Create alert summary file
                 self.repo.create_file(
                     path=f"ALERT_{alert.get_short_id()}.md",
                     message=f"Initialize fix branch for alert {alert.get_short_id()}",
-                    content=readme_content,
+                    content=_fix_branch_readme(alert),
                     branch=branch_name
                 )
                 logger.info(f"Created branch {branch_name} with initial commit")
-                
+
             except GithubException as e:
                 logger.error(f"Failed to create branch: {e}")
                 raise
-            
+
             # Create PR as draft (head branch -> base branch)
             pr = self.repo.create_pull(
                 title=title,
@@ -128,163 +782,66 @@ See PR description for full details.
                 base=base,  # Target branch (develop)
                 draft=True
             )
-            
-            # Add labels
-            try:
-                labels = ["bug", "automated"]
-                if alert.severity == "CRITICAL":
-                    labels.append("critical")
-                pr.add_to_labels(*labels)
-            except:
-                pass  # Labels might not exist
-            
+
+            # Add labels that actually exist on the repo
+            labels = [name for name in _alert_labels(alert) if name in _repo_label_names()]
+            if labels:
+                try:
+                    pr.add_to_labels(*labels)
+                except GithubException as e:
+                    logger.warning(f"Could not label PR #{pr.number}: {e}")
+
+            _remember_pr(fingerprint, pr.html_url)
             return pr.html_url
-        
+
         except Exception as e:
             logger.error(f"Error creating PR: {e}", exc_info=True)
             return None
-    
+
     def create_issue_from_alert(self, alert: Alert) -> Optional[str]:
         """
         Create a GitHub issue from an alert.
-        
+
         Args:
             alert: Alert object with error details
-        
+
         Returns:
             Issue URL if successful, None otherwise
         """
         try:
-            title = self._generate_issue_title(alert)
-            body = self._generate_issue_body(alert)
-            
-            # Create issue
+            title = _generate_issue_title(alert)
+            body = _generate_issue_body(alert)
+
+            # Labels go in the creation payload, saving the follow-up
+            # add_to_labels round-trip
+            labels = [name for name in _alert_labels(alert) if name in _repo_label_names()]
             issue = self.repo.create_issue(
                 title=title,
                 body=body,
+                labels=labels,
             )
-            
-            # Add labels
-            try:
-                labels = ["bug", "automated"]
-                if alert.severity == "CRITICAL":
-                    labels.append("critical")
-                issue.add_to_labels(*labels)
-            except:
-                pass
-            
+
             return issue.html_url
-        
+
         except Exception as e:
             logger.error(f"Error creating issue: {e}", exc_info=True)
             return None
-    
-    def _generate_pr_title(self, alert: Alert) -> str:
-        """Generate PR title from alert."""
-        return f"Fix: {alert.exception_type} in {alert.service_name}"
-    def _generate_pr_body(self, alert: Alert, fix_notes: Optional[str] = None) -> str:
-        """Generate PR body from alert."""
-        body = f"""## 🚨 Auto-generated PR from Alert {alert.get_short_id()}
-
-### What Happened
-An error was detected in **{alert.environment}** environment.
 
-### Error Summary
-- **Service**: {alert.service_name}
-- **Exception**: {alert.exception_type}
-- **Message**: {alert.error_message}
-- **Endpoint**: {alert.request_path or 'N/A'}
-- **Timestamp**: {alert.timestamp}
-- **Django Alert**: [{alert.django_alert_id[:8]}]({alert.get_django_url()})
-
-### Stack Trace
-```
-{alert.get_trimmed_stack_trace()}
-```
-
-### Additional Context
-```json
-{json.dumps(alert.additional_context, indent=2) if alert.additional_context else 'None'}
-```
-
-### Expected Behavior
-The application should handle this case gracefully without throwing an exception.
-
-### Actual Behavior
-The application encountered an unhandled exception.
-
-"""
-        
-        if fix_notes:
-            body += f"""### Proposed Fix
-{fix_notes}
-
-"""
-        
-        body += f"""### Alert Reference
-- **Alert ID**: `{alert.alert_id}`
-- **Django ID**: `{alert.django_alert_id}`
-- **Environment**: `{alert.environment}`
-- **View in Django**: {alert.get_django_url()}
-
----
-*This PR was automatically generated by the Jinkies monitoring bot.*
-"""
-        
-        return body
-    
-    def _generate_issue_title(self, alert: Alert) -> str:
-        """Generate issue title from alert."""
-        return f"[{alert.severity}] {alert.exception_type}: {alert.error_message[:50]}"
-    
-    def _generate_issue_body(self, alert: Alert) -> str:
-        """Generate issue body from alert."""
-        body = f"""## Error Report (Alert {alert.get_short_id()})
-
-### Environment
-- **Service**: {alert.service_name}
-- **Environment**: {alert.environment}
-- **Timestamp**: {alert.timestamp}
-- **Severity**: {alert.severity}
-
-### Error Details
-**Exception Type**: {alert.exception_type}
-
-**Error Message**:
-```
-{alert.error_message}
-```
-
-**Request Path**: {alert.request_path or 'N/A'}
-
-**Django Alert**: [{alert.django_alert_id[:8]}]({alert.get_django_url()})
-
-### Stack Trace
-```
-{alert.get_trimmed_stack_trace()}
-```
-
-### Additional Context
-```json
-{json.dumps(alert.additional_context, indent=2) if alert.additional_context else 'None'}
-```
+    def test_connection(self) -> bool:
+        """Test GitHub API connection.
 
-### Alert Reference
-- **Jinkies ID**: `{alert.alert_id}`
-- **Django ID**: `{alert.django_alert_id}`
-- **View in Django**: {alert.get_django_url()}
+        Positive results are cached for 60s - failures are re-probed
+        every call.
+        """
+        cls = type(self)
+        if cls._connection_ok_at and time.monotonic() - cls._connection_ok_at < 60:
+            return True
 
----
-*This issue was automatically created by the Jinkies monitoring bot.*
-"""
-        
-        return body
-    
-    def test_connection(self) -> bool:
-        """Test GitHub API connection."""
         try:
             self.repo.get_branches()
+            cls._connection_ok_at = time.monotonic()
             return True
         except Exception as e:
+            cls._connection_ok_at = None
             logger.error(f"GitHub connection test failed: {e}", exc_info=True)
             return False
@@ -1,30 +1,77 @@
 """
 Utility functions for Discord message formatting.
 """
+import bisect
+import itertools
+
 import discord
 from typing import List, Optional
 from bot.models.alert import Alert, LogEntry
 from bot.config import config
 
+# Severity -> embed color, built once; discord.Color constructors
+# allocate, so rebuilding this per alert is pure overhead
+_SEVERITY_COLORS = {
+    "INFO": discord.Color.blue(),
+    "WARNING": discord.Color.gold(),
+    "ERROR": discord.Color.red(),
+    "CRITICAL": discord.Color.dark_red(),
+}
+_DEFAULT_SEVERITY_COLOR = discord.Color.red()
+
+# Static (label, style, emoji, custom_id) specs for the alert action
+# buttons; the View itself is rebuilt per alert because callers attach
+# per-alert state to it (see AlertCommands.alert)
+_ALERT_BUTTONS = (
+    ("Create PR", discord.ButtonStyle.primary, "🔧", "alert_create_pr"),
+    ("Create Issue", discord.ButtonStyle.secondary, "🐛", "alert_create_issue"),
+    ("View Logs", discord.ButtonStyle.secondary, "📜", "alert_view_logs"),
+    ("Acknowledge", discord.ButtonStyle.success, "✅", "alert_acknowledge"),
+)
+
+
+# Rendered embeds keyed by alert_id: fan-out (alert channel + copilot
+# channel + /alert command) renders the same alert repeatedly, and
+# Embed.from_dict skips the ~10 add_field validation passes a rebuild
+# pays. Entries also record the mutable fields shown in the embed so
+# acknowledgements and new GitHub links still trigger a re-render.
+_EMBED_CACHE_MAX = 256
+_embed_cache: dict = {}
+
 
 def create_alert_embed(alert: Alert) -> discord.Embed:
     """
     Create a rich embed for an alert.
-    
+
     Args:
         alert: Alert object
-    
+
     Returns:
         Discord Embed object
     """
+    state = (
+        alert.acknowledged,
+        alert.acknowledged_by,
+        alert.github_pr_url,
+        alert.github_issue_url,
+    )
+    cached = _embed_cache.get(alert.alert_id)
+    if cached is not None and cached[0] == state:
+        return discord.Embed.from_dict(cached[1])
+
+    embed = _build_alert_embed(alert)
+
+    if len(_embed_cache) >= _EMBED_CACHE_MAX:
+        del _embed_cache[next(iter(_embed_cache))]
+    _embed_cache[alert.alert_id] = (state, embed.to_dict())
+
+    return embed
+
+
+def _build_alert_embed(alert: Alert) -> discord.Embed:
+    """Render an alert embed from scratch (cache miss path)."""
     # Determine color based on severity
-    color_map = {
-        "INFO": discord.Color.blue(),
-        "WARNING": discord.Color.gold(),
-        "ERROR": discord.Color.red(),
-        "CRITICAL": discord.Color.dark_red(),
-    }
-    color = color_map.get(alert.severity, discord.Color.red())
+    color = _SEVERITY_COLORS.get(alert.severity, _DEFAULT_SEVERITY_COLOR)
     
     # Create embed
     embed = discord.Embed(
@@ -79,44 +126,10 @@ def create_alert_buttons() -> discord.ui.View:
         Discord View with buttons
     """
     view = discord.ui.View(timeout=None)
-    
-    # Create PR button
-    pr_button = discord.ui.Button(
-        label="Create PR",
-        style=discord.ButtonStyle.primary,
-        emoji="🔧",
-        custom_id="alert_create_pr"
-    )
-    
-    # Create Issue button
-    issue_button = discord.ui.Button(
-        label="Create Issue",
-        style=discord.ButtonStyle.secondary,
-        emoji="🐛",
-        custom_id="alert_create_issue"
-    )
-    
-    # View Logs button
-    logs_button = discord.ui.Button(
-        label="View Logs",
-        style=discord.ButtonStyle.secondary,
-        emoji="📜",
-        custom_id="alert_view_logs"
-    )
-    
-    # Acknowledge button
-    ack_button = discord.ui.Button(
-        label="Acknowledge",
-        style=discord.ButtonStyle.success,
-        emoji="✅",
-        custom_id="alert_acknowledge"
-    )
-    
-    view.add_item(pr_button)
-    view.add_item(issue_button)
-    view.add_item(logs_button)
-    view.add_item(ack_button)
-    
+    for label, style, emoji, custom_id in _ALERT_BUTTONS:
+        view.add_item(
+            discord.ui.Button(label=label, style=style, emoji=emoji, custom_id=custom_id)
+        )
     return view
 
 
@@ -135,20 +148,29 @@ def format_logs_for_discord(logs: List[LogEntry], max_length: int = None) -> str
         return "No logs found."
     
     max_length = max_length or config.MAX_MESSAGE_LENGTH
-    
-    formatted = "```\n"
-    for log in logs:
+
+    # Accumulate lines in a list with a running length counter and join
+    # once - growing a string with += copies the whole message per line.
+    # The append bound method and the budget are hoisted out of the loop
+    # so the per-line work is just a length check and a list append.
+    parts = ["```\n"]
+    append = parts.append
+    total = 4  # opening fence
+    budget = max_length - 3  # closing ```
+    log_count = len(logs)
+    for i, log in enumerate(logs):
         line = log.format_for_discord() + "\n"
-        
+
         # Check if adding this line would exceed max length
-        if len(formatted) + len(line) + 3 > max_length:  # +3 for closing ```
-            formatted += f"... ({len(logs) - logs.index(log)} more entries)\n"
+        if total + len(line) > budget:
+            append(f"... ({log_count - i} more entries)\n")
             break
-        
-        formatted += line
-    
-    formatted += "```"
-    return formatted
+
+        append(line)
+        total += len(line)
+
+    parts.append("```")
+    return "".join(parts)
 
 
 def create_log_embed(service: str, logs: List[LogEntry], filters: Optional[dict] = None) -> discord.Embed:
@@ -201,20 +223,26 @@ def chunk_message(text: str, max_length: int = 1900) -> List[str]:
     """
     if len(text) <= max_length:
         return [text]
-    
+
+    # Prefix sums over line lengths let each chunk boundary be found with
+    # a bisect and each chunk built with one join, instead of growing a
+    # string line by line (which copies the whole chunk per append)
+    lines = text.split("\n")
+    cum = list(itertools.accumulate(len(line) + 1 for line in lines))
+
     chunks = []
-    current_chunk = ""
-    
-    for line in text.split("\n"):
-        if len(current_chunk) + len(line) + 1 > max_length:
-            chunks.append(current_chunk)
-            current_chunk = line + "\n"
-        else:
-            current_chunk += line + "\n"
-    
-    if current_chunk:
-        chunks.append(current_chunk)
-    
+    lo = 0
+    start = 0
+    line_count = len(lines)
+    bisect_right = bisect.bisect_right
+    while lo < line_count:
+        hi = bisect_right(cum, start + max_length, lo)
+        if hi == lo:
+            hi = lo + 1  # single line longer than max_length keeps its own chunk
+        chunks.append("\n".join(lines[lo:hi]) + "\n")
+        start = cum[hi - 1]
+        lo = hi
+
     return chunks
 
 
@@ -230,11 +258,11 @@ def has_required_role(interaction: discord.Interaction) -> bool:
     """
     if not interaction.user.roles:
         return False
-    
-    user_roles = [role.name for role in interaction.user.roles]
+
+    # DISCORD_ALLOWED_ROLES is a frozenset, so each check is O(1) and the
+    # generator short-circuits on the first allowed role
     allowed_roles = config.DISCORD_ALLOWED_ROLES
-    
-    return any(role in allowed_roles for role in user_roles)
+    return any(role.name in allowed_roles for role in interaction.user.roles)
 
 
 def format_error_message(error: str) -> str:
@@ -1,8 +1,13 @@
 """
 Django views for Jinkies webhook integration.
 """
-import json
-from django.http import JsonResponse
+import gzip
+import logging
+import queue
+import threading
+
+import orjson
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
@@ -17,15 +22,44 @@ from bot.services.alert_store import AlertStore
 from bot.config import config
 
 
+logger = logging.getLogger("jinkies.django_webhook")
+
 # Initialize alert store
 alert_store = AlertStore()
 
+# Persistence happens off the request thread: save_alert can sleep and
+# retry on SQLite lock contention, which would otherwise hold a WSGI
+# worker hostage during an alert storm. The queue is bounded so a storm
+# backpressures with a 503 instead of growing without limit.
+_alert_queue = queue.Queue(maxsize=1000)
+
+
+def _store_worker():
+    """Drain the alert queue into the store (runs on a daemon thread)."""
+    while True:
+        alert = _alert_queue.get()
+        try:
+            alert_store.save_alert(alert)
+        except Exception:
+            logger.exception(f"Failed to store alert {alert.alert_id}")
+        finally:
+            _alert_queue.task_done()
+
+
+_worker = threading.Thread(target=_store_worker, name="jinkies-alert-store", daemon=True)
+_worker.start()
+
+
+def _json_response(payload, status=200):
+    """Serialize a response with orjson, skipping JsonResponse's str round-trip."""
+    return HttpResponse(orjson.dumps(payload), content_type="application/json", status=status)
+
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def health(request):
     """Health check endpoint."""
-    return JsonResponse({"status": "healthy", "service": "jinkies-webhook"})
+    return _json_response({"status": "healthy", "service": "jinkies-webhook"})
 
 
 @csrf_exempt
@@ -54,7 +88,15 @@ def receive_alert(request):
     }
     """
     try:
-        data = json.loads(request.body)
+        # Senders may gzip the body (stack traces compress ~2x);
+        # Django's WSGI layer does not inflate request payloads itself
+        body = request.body
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+
+        # orjson parses alert payloads (stack traces + related logs can
+        # be tens of KB) several times faster than stdlib json
+        data = orjson.loads(body)
         
         # Create alert object
         alert = Alert(
@@ -71,16 +113,23 @@ def receive_alert(request):
             additional_context=data.get("additional_context", {})
         )
         
-        # Save alert to store
-        alert_store.save_alert(alert)
-        
-        return JsonResponse({
+        # Queue the alert for the store worker and return immediately
+        try:
+            _alert_queue.put_nowait(alert)
+        except queue.Full:
+            logger.error("Alert queue full; dropping alert")
+            return _json_response({
+                "status": "error",
+                "message": "alert queue full"
+            }, status=503)
+
+        return _json_response({
             "status": "success",
             "alert_id": alert.alert_id
         }, status=201)
     
     except Exception as e:
-        return JsonResponse({
+        return _json_response({
             "status": "error",
             "message": str(e)
         }, status=500)
@@ -55,8 +55,11 @@ echo ""
 # Activate virtual environment and install dependencies
 echo "📦 Installing Python dependencies..."
 source venv/bin/activate
-pip install -q --upgrade pip
-pip install -q -r requirements-pi.txt || {
+# --disable-pip-version-check skips pip's self-check HTTP round-trip,
+# --no-input keeps the script non-interactive, and --prefer-binary
+# avoids slow source builds on the Pi when wheels exist
+pip install -q --disable-pip-version-check --no-input --upgrade pip
+pip install -q --disable-pip-version-check --no-input --prefer-binary -r requirements-pi.txt || {
     echo "❌ Failed to install Python dependencies"
     exit 1
 }
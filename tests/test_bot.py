@@ -1,12 +1,11 @@
 """
 Unit tests for Jinkies bot.
 """
+import sqlite3
 import unittest
 from datetime import datetime
 from bot.models.alert import Alert, LogEntry
 from bot.services.alert_store import AlertStore
-import os
-import tempfile
 
 
 class TestAlert(unittest.TestCase):
@@ -88,17 +87,26 @@ class TestLogEntry(unittest.TestCase):
 
 class TestAlertStore(unittest.TestCase):
     """Test AlertStore service."""
-    
-    def setUp(self):
-        """Create temporary database for testing."""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        self.temp_db.close()
-        self.store = AlertStore(db_path=self.temp_db.name)
-    
+
+    # One shared in-memory database for the whole class instead of a
+    # fresh temp file (and schema build) per test method. The keeper
+    # connection pins the shared-cache database alive between the
+    # store's short-lived per-operation connections.
+    DB_URI = "file:jinkies-test-alerts?mode=memory&cache=shared"
+
+    @classmethod
+    def setUpClass(cls):
+        cls._keeper = sqlite3.connect(cls.DB_URI, uri=True)
+        cls.store = AlertStore(db_path=cls.DB_URI)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._keeper.close()
+
     def tearDown(self):
-        """Clean up temporary database."""
-        if os.path.exists(self.temp_db.name):
-            os.unlink(self.temp_db.name)
+        """Reset table contents between tests."""
+        self._keeper.execute("DELETE FROM alerts")
+        self._keeper.commit()
     
     def test_save_and_retrieve_alert(self):
         """Test saving and retrieving an alert."""